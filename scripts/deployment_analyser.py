@@ -2,6 +2,8 @@ import os
 import sys
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import yaml
 import re
@@ -11,6 +13,67 @@ from pathlib import Path
 from urllib.parse import urlparse, urljoin
 import time
 import concurrent.futures
+import string
+
+
+# Markdown skeleton for generate_deployment_report; the variable sections are
+# rendered separately and substituted in a single pass.
+_REPORT_TEMPLATE = string.Template("""\
+# Deployment Analysis Report
+
+**GitHub Repository:** [${repo_owner}/${repo_name}](${github_repo_url})
+
+**Netlify Deployment:** [${netlify_domain}](${netlify_url})
+
+**Analysis Date:** ${analysis_date}
+
+## Overall Assessment
+
+**Overall Score:** ${overall_score}/10
+
+**Performance Level:** ${performance_level}
+
+**Points:** ${points}/10 (${percentage}%)
+
+### Rubric Criteria
+
+| Performance Level | Description | Points |
+|-------------------|-------------|--------|
+| Distinction (75-100%) | Expert deployment with optimised settings and CI/CD implementation | 7.5-10 |
+| Credit (65-74%) | Smooth deployment with proper configuration | 6.5-7.49 |
+| Pass (50-64%) | Basic deployment with functional site | 5-6.49 |
+| Fail (0-49%) | Deployment issues or incorrect implementation | 0-4.99 |
+
+## GitHub Workflow Analysis
+
+**Workflow Score:** ${workflow_score}/10
+
+${workflow_details}
+
+## Netlify Configuration
+
+${config_details}
+
+## Netlify Deployment Analysis
+
+**Netlify Score:** ${netlify_score}/10
+
+${netlify_details}
+
+## Strengths and Recommendations
+
+### Strengths
+
+${strengths}
+
+### Recommendations
+
+${recommendations}
+
+## Conclusion
+
+${conclusion}
+""")
 
 
 class DeploymentAnalyzer:
@@ -35,6 +98,16 @@ class DeploymentAnalyzer:
         # Extract repository owner and name from URL
         self.repo_owner, self.repo_name = self._extract_repo_info()
         
+        # Shared HTTP session so GitHub API and Netlify requests reuse pooled connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
         # GitHub API details
         self.github_api_base = "https://api.github.com"
         self.github_headers = {}
@@ -138,7 +211,7 @@ class DeploymentAnalyzer:
 
         # Try to fetch the Netlify site URL and check response status code
         try:
-            response = requests.get(f"https://{self.netlify_domain}", timeout=10) # Add timeout
+            response = self.session.get(f"https://{self.netlify_domain}", timeout=10) # Add timeout
             if response.status_code == 200:
                 print("Netlify site is active.")
                 return 1 # Return 1 for active
@@ -155,7 +228,7 @@ class DeploymentAnalyzer:
         url = f"{self.github_api_base}/repos/{self.repo_owner}/{self.repo_name}/contents/{path}"
         
         try:
-            response = requests.get(url, headers=self.github_headers)
+            response = self.session.get(url, headers=self.github_headers)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
@@ -178,7 +251,7 @@ class DeploymentAnalyzer:
             for item in workflow_contents:
                 if item["type"] == "file" and (item["name"].endswith(".yml") or item["name"].endswith(".yaml")):
                     url = f"{self.github_api_base}/repos/{self.repo_owner}/{self.repo_name}/contents/{item['path']}"
-                    response = requests.get(url, headers=self.github_headers)
+                    response = self.session.get(url, headers=self.github_headers)
                     response.raise_for_status()
                     
                     content = response.json()
@@ -204,7 +277,7 @@ class DeploymentAnalyzer:
             netlify_toml = self.get_repo_contents("netlify.toml")
             if netlify_toml and netlify_toml.get("type") == "file":
                 url = netlify_toml["download_url"]
-                response = requests.get(url)
+                response = self.session.get(url)
                 response.raise_for_status()
                 
                 netlify_files.append({
@@ -219,7 +292,7 @@ class DeploymentAnalyzer:
             redirects = self.get_repo_contents("_redirects")
             if redirects and redirects.get("type") == "file":
                 url = redirects["download_url"]
-                response = requests.get(url)
+                response = self.session.get(url)
                 response.raise_for_status()
                 
                 netlify_files.append({
@@ -234,7 +307,7 @@ class DeploymentAnalyzer:
             headers = self.get_repo_contents("_headers")
             if headers and headers.get("type") == "file":
                 url = headers["download_url"]
-                response = requests.get(url)
+                response = self.session.get(url)
                 response.raise_for_status()
                 
                 netlify_files.append({
@@ -552,7 +625,7 @@ class DeploymentAnalyzer:
         # Check if site loads and measure load time
         try:
             start_time = time.time()
-            response = requests.get(self.netlify_url, timeout=10)
+            response = self.session.get(self.netlify_url, timeout=10)
             end_time = time.time()
             
             load_time = end_time - start_time
@@ -825,15 +898,19 @@ class DeploymentAnalyzer:
                 "recommendations": recommendations_msg
             }
 
-        # Get and analyze workflow files
-        workflow_files = self.get_workflow_files()
-        workflow_analysis = self.analyze_workflow_files(workflow_files)
-        
-        # Get and analyze Netlify config files
-        netlify_config_files = self.get_netlify_config()
-        
-        # Analyze Netlify deployment
-        netlify_analysis = self.analyze_netlify_deployment()
+        try:
+            # Get and analyze workflow files
+            workflow_files = self.get_workflow_files()
+            workflow_analysis = self.analyze_workflow_files(workflow_files)
+            
+            # Get and analyze Netlify config files
+            netlify_config_files = self.get_netlify_config()
+            
+            # Analyze Netlify deployment
+            netlify_analysis = self.analyze_netlify_deployment()
+        finally:
+            # All network access is done; release pooled connections
+            self.session.close()
         
         # Calculate overall score
         workflow_score = workflow_analysis["workflow_score"]
@@ -881,225 +958,204 @@ class DeploymentAnalyzer:
         """
         report_path = os.path.join(self.output_dir, "deployment_analysis.md")
         
-        with open(report_path, "w", encoding="utf-8") as f:
-            f.write("# Deployment Analysis Report\n\n")
-            f.write(f"**GitHub Repository:** [{self.repo_owner}/{self.repo_name}]({self.github_repo_url})\n\n")
-            f.write(f"**Netlify Deployment:** [{self.netlify_domain}]({self.netlify_url})\n\n")
-            f.write(f"**Analysis Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            
-            # Overall assessment
-            f.write("## Overall Assessment\n\n")
-            f.write(f"**Overall Score:** {overall_score:.2f}/10\n\n")
-            f.write(f"**Performance Level:** {performance_level}\n\n")
-            f.write(f"**Points:** {points}/10 ({percentage}%)\n\n")
-            
-            f.write("### Rubric Criteria\n\n")
-            f.write("| Performance Level | Description | Points |\n")
-            f.write("|-------------------|-------------|--------|\n")
-            f.write("| Distinction (75-100%) | Expert deployment with optimised settings and CI/CD implementation | 7.5-10 |\n")
-            f.write("| Credit (65-74%) | Smooth deployment with proper configuration | 6.5-7.49 |\n")
-            f.write("| Pass (50-64%) | Basic deployment with functional site | 5-6.49 |\n")
-            f.write("| Fail (0-49%) | Deployment issues or incorrect implementation | 0-4.99 |\n\n")
+        # GitHub workflow analysis
+        if workflow_analysis["has_workflow_files"]:
+            workflow_lines = [f"- **Workflow Files Found:** Yes ({workflow_analysis['workflows_analyzed']} files)"]
             
-            # GitHub workflow analysis
-            f.write("## GitHub Workflow Analysis\n\n")
+            if workflow_analysis["netlify_deploy_workflows"]:
+                workflow_lines.append(f"- **Netlify Deployment Workflows:** Yes ({len(workflow_analysis['netlify_deploy_workflows'])} files)")
+                workflow_lines.extend(f"  - {workflow}" for workflow in workflow_analysis["netlify_deploy_workflows"])
+            else:
+                workflow_lines.append("- **Netlify Deployment Workflows:** No")
             
-            workflow_score = workflow_analysis["workflow_score"]
-            f.write(f"**Workflow Score:** {workflow_score:.2f}/10\n\n")
+            workflow_lines.append(f"- **Build Steps Present:** {'Yes' if workflow_analysis['build_steps_present'] else 'No'}")
+            workflow_lines.append(f"- **Test Steps Present:** {'Yes' if workflow_analysis['test_steps_present'] else 'No'}")
+            workflow_lines.append(f"- **Conditional Deployment:** {'Yes' if workflow_analysis['conditional_deploy'] else 'No'}")
+            workflow_lines.append(f"- **Dependency Caching:** {'Yes' if workflow_analysis['cache_dependencies'] else 'No'}")
+        else:
+            workflow_lines = ["- **Workflow Files Found:** No"]
+        
+        # Netlify configuration
+        if netlify_config_files:
+            config_blocks = [f"**Configuration Files Found:** Yes ({len(netlify_config_files)} files)"]
             
-            if workflow_analysis["has_workflow_files"]:
-                f.write(f"- **Workflow Files Found:** Yes ({workflow_analysis['workflows_analyzed']} files)\n")
-                
-                if workflow_analysis["netlify_deploy_workflows"]:
-                    f.write(f"- **Netlify Deployment Workflows:** Yes ({len(workflow_analysis['netlify_deploy_workflows'])} files)\n")
-                    for workflow in workflow_analysis["netlify_deploy_workflows"]:
-                        f.write(f"  - {workflow}\n")
-                else:
-                    f.write("- **Netlify Deployment Workflows:** No\n")
-                
-                f.write(f"- **Build Steps Present:** {'Yes' if workflow_analysis['build_steps_present'] else 'No'}\n")
-                f.write(f"- **Test Steps Present:** {'Yes' if workflow_analysis['test_steps_present'] else 'No'}\n")
-                f.write(f"- **Conditional Deployment:** {'Yes' if workflow_analysis['conditional_deploy'] else 'No'}\n")
-                f.write(f"- **Dependency Caching:** {'Yes' if workflow_analysis['cache_dependencies'] else 'No'}\n")
-            else:
-                f.write("- **Workflow Files Found:** No\n")
+            for config_file in netlify_config_files:
+                content = config_file['content'][:500]  # Show only first 500 characters
+                if len(config_file['content']) > 500:
+                    content += "\n... (truncated)"
+                config_blocks.append(f"### {config_file['name']}\n\n```\n{content}\n```")
+        else:
+            config_blocks = [
+                "**Configuration Files Found:** No",
+                "No Netlify configuration files (netlify.toml, _redirects, _headers) were found in the repository."
+            ]
+        
+        # Netlify deployment analysis
+        netlify_lines = [
+            f"- **Site URL:** [{netlify_analysis['site_url']}]({netlify_analysis['site_url']})",
+            f"- **Site Loads:** {'Yes' if netlify_analysis['site_loads'] else 'No'}"
+        ]
+        
+        if netlify_analysis["site_loads"]:
+            seo_results = netlify_analysis["basic_seo"]
+            netlify_lines.extend([
+                f"- **Load Time:** {netlify_analysis['load_time']:.2f} seconds",
+                f"- **SSL Configured:** {'Yes' if netlify_analysis['ssl_configured'] else 'No'}",
+                f"- **Custom Domain:** {'Yes' if netlify_analysis['custom_domain'] else 'No'}",
+                f"- **Responsive Design:** {'Yes' if netlify_analysis['responsive_design'] else 'No'}",
+                # SEO details
+                "- **Basic SEO:**",
+                f"  - Title tag: {'Present' if seo_results.get('has_title', False) else 'Missing'}",
+                f"  - Meta description: {'Present' if seo_results.get('has_meta_description', False) else 'Missing'}",
+                f"  - Viewport meta tag: {'Present' if seo_results.get('has_viewport_meta', False) else 'Missing'}",
+                f"  - H1 heading: {'Present' if seo_results.get('has_h1', False) else 'Missing'}",
+                f"  - Image alt attributes: {'Properly used' if seo_results.get('has_img_alt', False) else 'Missing on some images'}"
+            ])
+        
+        # Identify strengths
+        strengths = []
+        
+        # GitHub workflow strengths
+        if workflow_analysis["has_workflow_files"]:
+            strengths.append("GitHub Actions workflows are set up for automation")
             
-            # Netlify configuration
-            f.write("\n## Netlify Configuration\n\n")
+            if workflow_analysis["netlify_deploy_workflows"]:
+                strengths.append("Automated Netlify deployment configured in workflows")
             
-            if netlify_config_files:
-                f.write(f"**Configuration Files Found:** Yes ({len(netlify_config_files)} files)\n\n")
-                
-                for config_file in netlify_config_files:
-                    f.write(f"### {config_file['name']}\n\n")
-                    f.write("```\n")
-                    f.write(config_file['content'][:500])  # Show only first 500 characters
-                    if len(config_file['content']) > 500:
-                        f.write("\n... (truncated)")
-                    f.write("\n```\n\n")
-            else:
-                f.write("**Configuration Files Found:** No\n\n")
-                f.write("No Netlify configuration files (netlify.toml, _redirects, _headers) were found in the repository.\n\n")
+            if workflow_analysis["build_steps_present"]:
+                strengths.append("Build steps are properly configured in workflows")
             
-            # Netlify deployment analysis
-            f.write("## Netlify Deployment Analysis\n\n")
+            if workflow_analysis["test_steps_present"]:
+                strengths.append("Test steps are included in the CI/CD process")
             
-            netlify_score = netlify_analysis["netlify_score"]
-            f.write(f"**Netlify Score:** {netlify_score:.2f}/10\n\n")
+            if workflow_analysis["conditional_deploy"]:
+                strengths.append("Conditional deployment logic prevents unnecessary deployments")
             
-            f.write(f"- **Site URL:** [{netlify_analysis['site_url']}]({netlify_analysis['site_url']})\n")
-            f.write(f"- **Site Loads:** {'Yes' if netlify_analysis['site_loads'] else 'No'}\n")
+            if workflow_analysis["cache_dependencies"]:
+                strengths.append("Dependency caching improves workflow efficiency")
+        
+        # Netlify strengths
+        if netlify_analysis["site_loads"]:
+            strengths.append("Site is successfully deployed and accessible")
             
-            if netlify_analysis["site_loads"]:
-                f.write(f"- **Load Time:** {netlify_analysis['load_time']:.2f} seconds\n")
-                f.write(f"- **SSL Configured:** {'Yes' if netlify_analysis['ssl_configured'] else 'No'}\n")
-                f.write(f"- **Custom Domain:** {'Yes' if netlify_analysis['custom_domain'] else 'No'}\n")
-                f.write(f"- **Responsive Design:** {'Yes' if netlify_analysis['responsive_design'] else 'No'}\n")
-                
-                # SEO details
-                seo_results = netlify_analysis["basic_seo"]
-                f.write("- **Basic SEO:**\n")
-                f.write(f"  - Title tag: {'Present' if seo_results.get('has_title', False) else 'Missing'}\n")
-                f.write(f"  - Meta description: {'Present' if seo_results.get('has_meta_description', False) else 'Missing'}\n")
-                f.write(f"  - Viewport meta tag: {'Present' if seo_results.get('has_viewport_meta', False) else 'Missing'}\n")
-                f.write(f"  - H1 heading: {'Present' if seo_results.get('has_h1', False) else 'Missing'}\n")
-                f.write(f"  - Image alt attributes: {'Properly used' if seo_results.get('has_img_alt', False) else 'Missing on some images'}\n")
+            if netlify_analysis["ssl_configured"]:
+                strengths.append("SSL is properly configured (HTTPS)")
             
-            # Strengths and recommendations
-            f.write("\n## Strengths and Recommendations\n\n")
+            if netlify_analysis["custom_domain"]:
+                strengths.append("Custom domain is configured instead of default Netlify domain")
             
-            # Identify strengths
-            f.write("### Strengths\n\n")
-            strengths = []
+            if netlify_analysis["load_time"] and netlify_analysis["load_time"] < 2.0:
+                strengths.append(f"Site loads quickly ({netlify_analysis['load_time']:.2f} seconds)")
             
-            # GitHub workflow strengths
-            if workflow_analysis["has_workflow_files"]:
-                strengths.append("GitHub Actions workflows are set up for automation")
-                
-                if workflow_analysis["netlify_deploy_workflows"]:
-                    strengths.append("Automated Netlify deployment configured in workflows")
-                
-                if workflow_analysis["build_steps_present"]:
-                    strengths.append("Build steps are properly configured in workflows")
-                
-                if workflow_analysis["test_steps_present"]:
-                    strengths.append("Test steps are included in the CI/CD process")
-                
-                if workflow_analysis["conditional_deploy"]:
-                    strengths.append("Conditional deployment logic prevents unnecessary deployments")
-                
-                if workflow_analysis["cache_dependencies"]:
-                    strengths.append("Dependency caching improves workflow efficiency")
+            if netlify_analysis["responsive_design"]:
+                strengths.append("Site implements responsive design principles")
             
-            # Netlify strengths
-            if netlify_analysis["site_loads"]:
-                strengths.append("Site is successfully deployed and accessible")
-                
-                if netlify_analysis["ssl_configured"]:
-                    strengths.append("SSL is properly configured (HTTPS)")
-                
-                if netlify_analysis["custom_domain"]:
-                    strengths.append("Custom domain is configured instead of default Netlify domain")
-                
-                if netlify_analysis["load_time"] and netlify_analysis["load_time"] < 2.0:
-                    strengths.append(f"Site loads quickly ({netlify_analysis['load_time']:.2f} seconds)")
-                
-                if netlify_analysis["responsive_design"]:
-                    strengths.append("Site implements responsive design principles")
-                
-                # SEO strengths
-                seo_score = netlify_analysis["basic_seo"].get("seo_score", 0)
-                if seo_score > 0.7:
-                    strengths.append("Good implementation of basic SEO elements")
+            # SEO strengths
+            seo_score = netlify_analysis["basic_seo"].get("seo_score", 0)
+            if seo_score > 0.7:
+                strengths.append("Good implementation of basic SEO elements")
+        
+        # Config file strengths
+        if netlify_config_files:
+            strengths.append("Netlify configuration files are present in the repository")
+        
+        # If no strengths found
+        if not strengths:
+            strengths.append("Basic GitHub and Netlify integration is established")
+        
+        # Identify recommendations
+        recommendations = []
+        
+        # GitHub workflow recommendations
+        if not workflow_analysis["has_workflow_files"]:
+            recommendations.append("Set up GitHub Actions workflows for CI/CD automation")
+        else:
+            if not workflow_analysis["netlify_deploy_workflows"]:
+                recommendations.append("Configure a workflow specifically for Netlify deployment")
             
-            # Config file strengths
-            if netlify_config_files:
-                strengths.append("Netlify configuration files are present in the repository")
+            if not workflow_analysis["build_steps_present"]:
+                recommendations.append("Add build steps to your workflow to ensure proper compilation")
             
-            # If no strengths found
-            if not strengths:
-                strengths.append("Basic GitHub and Netlify integration is established")
+            if not workflow_analysis["test_steps_present"]:
+                recommendations.append("Consider adding test steps to ensure code quality")
             
-            # Write strengths
-            for strength in strengths:
-                f.write(f"- {strength}\n")
+            if not workflow_analysis["conditional_deploy"]:
+                recommendations.append("Add conditional logic to only deploy on specific branches or events")
             
-            # Identify recommendations
-            f.write("\n### Recommendations\n\n")
-            recommendations = []
+            if not workflow_analysis["cache_dependencies"]:
+                recommendations.append("Implement dependency caching to speed up workflows")
+        
+        # Netlify recommendations
+        if not netlify_analysis["site_loads"]:
+            recommendations.append("Fix deployment issues as the site is not loading properly")
+        else:
+            if not netlify_analysis["ssl_configured"]:
+                recommendations.append("Configure SSL to use HTTPS for better security")
             
-            # GitHub workflow recommendations
-            if not workflow_analysis["has_workflow_files"]:
-                recommendations.append("Set up GitHub Actions workflows for CI/CD automation")
-            else:
-                if not workflow_analysis["netlify_deploy_workflows"]:
-                    recommendations.append("Configure a workflow specifically for Netlify deployment")
-                
-                if not workflow_analysis["build_steps_present"]:
-                    recommendations.append("Add build steps to your workflow to ensure proper compilation")
-                
-                if not workflow_analysis["test_steps_present"]:
-                    recommendations.append("Consider adding test steps to ensure code quality")
-                
-                if not workflow_analysis["conditional_deploy"]:
-                    recommendations.append("Add conditional logic to only deploy on specific branches or events")
-                
-                if not workflow_analysis["cache_dependencies"]:
-                    recommendations.append("Implement dependency caching to speed up workflows")
+            if netlify_analysis["load_time"] and netlify_analysis["load_time"] > 3.0:
+                recommendations.append(f"Optimize site performance to reduce load time ({netlify_analysis['load_time']:.2f} seconds)")
             
-            # Netlify recommendations
-            if not netlify_analysis["site_loads"]:
-                recommendations.append("Fix deployment issues as the site is not loading properly")
-            else:
-                if not netlify_analysis["ssl_configured"]:
-                    recommendations.append("Configure SSL to use HTTPS for better security")
-                
-                if netlify_analysis["load_time"] and netlify_analysis["load_time"] > 3.0:
-                    recommendations.append(f"Optimize site performance to reduce load time ({netlify_analysis['load_time']:.2f} seconds)")
-                
-                if not netlify_analysis["responsive_design"]:
-                    recommendations.append("Implement responsive design for better mobile experience")
-                
-                # SEO recommendations
-                seo_results = netlify_analysis["basic_seo"]
-                if not seo_results.get("has_title", False):
-                    recommendations.append("Add a descriptive title tag")
-                
-                if not seo_results.get("has_meta_description", False):
-                    recommendations.append("Add a meta description for better SEO")
-                
-                if not seo_results.get("has_viewport_meta", False):
-                    recommendations.append("Add a viewport meta tag for proper mobile display")
-                
-                if not seo_results.get("has_h1", False):
-                    recommendations.append("Include at least one H1 heading")
-                
-                if not seo_results.get("has_img_alt", False):
-                    recommendations.append("Add alt attributes to all images for accessibility")
+            if not netlify_analysis["responsive_design"]:
+                recommendations.append("Implement responsive design for better mobile experience")
             
-            # Config file recommendations
-            if not netlify_config_files:
-                recommendations.append("Add Netlify configuration files (netlify.toml) for more control over deployment settings")
+            # SEO recommendations
+            seo_results = netlify_analysis["basic_seo"]
+            if not seo_results.get("has_title", False):
+                recommendations.append("Add a descriptive title tag")
             
-            # If no recommendations found
-            if not recommendations:
-                recommendations.append("Continue maintaining current deployment practices")
+            if not seo_results.get("has_meta_description", False):
+                recommendations.append("Add a meta description for better SEO")
             
-            # Write recommendations
-            for recommendation in recommendations:
-                f.write(f"- {recommendation}\n")
+            if not seo_results.get("has_viewport_meta", False):
+                recommendations.append("Add a viewport meta tag for proper mobile display")
             
-            # Conclusion
-            f.write("\n## Conclusion\n\n")
+            if not seo_results.get("has_h1", False):
+                recommendations.append("Include at least one H1 heading")
             
-            if overall_score >= 8.5:
-                f.write("The deployment setup demonstrates excellent practices with both GitHub workflows and Netlify configuration. The CI/CD pipeline is well-optimized and the site is performing well.\n")
-            elif overall_score >= 7:
-                f.write("The deployment setup shows good practices with proper configuration of GitHub workflows and Netlify. With a few improvements, it could reach excellent status.\n")
-            elif overall_score >= 5:
-                f.write("The deployment setup meets basic requirements with a functional site, but there are several areas that could be improved for better efficiency and reliability.\n")
-            else:
-                f.write("The deployment setup has significant issues that need to be addressed. Focus on the recommendations to improve the deployment process and site functionality.\n")
+            if not seo_results.get("has_img_alt", False):
+                recommendations.append("Add alt attributes to all images for accessibility")
+        
+        # Config file recommendations
+        if not netlify_config_files:
+            recommendations.append("Add Netlify configuration files (netlify.toml) for more control over deployment settings")
+        
+        # If no recommendations found
+        if not recommendations:
+            recommendations.append("Continue maintaining current deployment practices")
+        
+        # Conclusion
+        if overall_score >= 8.5:
+            conclusion = "The deployment setup demonstrates excellent practices with both GitHub workflows and Netlify configuration. The CI/CD pipeline is well-optimized and the site is performing well."
+        elif overall_score >= 7:
+            conclusion = "The deployment setup shows good practices with proper configuration of GitHub workflows and Netlify. With a few improvements, it could reach excellent status."
+        elif overall_score >= 5:
+            conclusion = "The deployment setup meets basic requirements with a functional site, but there are several areas that could be improved for better efficiency and reliability."
+        else:
+            conclusion = "The deployment setup has significant issues that need to be addressed. Focus on the recommendations to improve the deployment process and site functionality."
+        
+        report = _REPORT_TEMPLATE.substitute(
+            repo_owner=self.repo_owner,
+            repo_name=self.repo_name,
+            github_repo_url=self.github_repo_url,
+            netlify_domain=self.netlify_domain,
+            netlify_url=self.netlify_url,
+            analysis_date=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            overall_score=f"{overall_score:.2f}",
+            performance_level=performance_level,
+            points=points,
+            percentage=percentage,
+            workflow_score=f"{workflow_analysis['workflow_score']:.2f}",
+            workflow_details="\n".join(workflow_lines),
+            config_details="\n\n".join(config_blocks),
+            netlify_score=f"{netlify_analysis['netlify_score']:.2f}",
+            netlify_details="\n".join(netlify_lines),
+            strengths="\n".join(f"- {strength}" for strength in strengths),
+            recommendations="\n".join(f"- {recommendation}" for recommendation in recommendations),
+            conclusion=conclusion
+        )
+        
+        with open(report_path, "w", encoding="utf-8") as f:
+            f.write(report)
         
         print(f"Deployment analysis report saved to {report_path}")
 
@@ -6,24 +6,47 @@ Traverse a root directory of student folders, find the first GitHub repo URL
 and Netlify link in any .md/.txt/.pdf/.docx under each student folder, extract username,
 and write one row per student. If none found, records "none".
 
+Documents are searched cheapest first (.md, .txt, .docx, then .pdf, smallest
+first within each type), so a link in a README wins over one in a PDF.
+
 Usage:
-    python extract_links.py [--ssh] <root_dir> <output.csv>
+    python extract_links.py [--ssh] [--cache-dir DIR] <root_dir> <output.csv>
+
+The link search is plain Python and re, so the script also runs unchanged
+under PyPy (e.g. `pypy3 extract_links.py ...`), which is noticeably faster on
+folders made up mostly of .md/.txt files. PyPDF2 is only imported once a PDF
+actually needs parsing.
 """
 
 import os
 import re
 import csv
 import argparse
+import io
 import logging
-
-import pdfplumber
-from docx import Document
+import mmap
+import hashlib
+import html
+import tempfile
+import zipfile
+from pathlib import Path
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # -----------------------------------------------------------------------------
-# Suppress pdfplumber and pdfminer warnings
+# Suppress PyPDF2 warnings
 # -----------------------------------------------------------------------------
-logging.getLogger("pdfplumber").setLevel(logging.ERROR)
-logging.getLogger("pdfminer").setLevel(logging.ERROR)
+logging.getLogger("PyPDF2").setLevel(logging.ERROR)
+
+# PyPDF2's PdfReader, imported on first use by _pdf_reader()
+PdfReader = None
+
+def _pdf_reader():
+    """Return PyPDF2's PdfReader, importing PyPDF2 the first time it is needed."""
+    global PdfReader
+    if PdfReader is None:
+        from PyPDF2 import PdfReader
+    return PdfReader
 
 # Regex to capture GitHub owner and repo
 GITHUB_REGEX = re.compile(
@@ -38,78 +61,313 @@ CLEAN_NETLIFY_REGEX = re.compile(
     r'https?://[A-Za-z0-9\-.]+\.netlify\.app(?:/[^\s"\'<>\)]*)?'
 )
 
-def extract_text_from_pdf(path):
-    """Extract all text from a PDF file using pdfplumber."""
-    texts = []
+# Bytes twins of the patterns above for scanning memory-mapped text files
+# without decoding. The two kinds of link are searched separately: fused into
+# one alternation, the raw Netlify match would swallow a GitHub URL that
+# follows it with no whitespace in between (e.g. in a Markdown table row).
+GITHUB_REGEX_BYTES = re.compile(GITHUB_REGEX.pattern.encode('ascii'))
+RAW_NETLIFY_REGEX_BYTES = re.compile(RAW_NETLIFY_REGEX.pattern.encode('ascii'))
+
+# Literal substrings every GitHub/Netlify match must contain, used to skip
+# regex scans of text that cannot match
+GITHUB_MARKER = 'github.com'
+NETLIFY_MARKER = 'netlify.app'
+GITHUB_MARKER_BYTES = GITHUB_MARKER.encode('ascii')
+NETLIFY_MARKER_BYTES = NETLIFY_MARKER.encode('ascii')
+
+# WordprocessingML markup: elements that separate text, or a <w:t> text run
+# (group 1). Deleted text (<w:delText>) and field codes (<w:instrText>) are
+# different elements, so they are never picked up.
+DOCX_TEXT_REGEX = re.compile(
+    r'</w:p>|<w:(?:br|cr|tab)\b[^>]*/>|<w:t(?:\s[^>]*)?(?<!/)>(.*?)</w:t>',
+    re.DOTALL
+)
+
+# Document types that may contain the submission links, in the order they are
+# searched: cheap plain-text files first so PDFs are rarely parsed at all
+LINK_FILE_PRIORITY = {'md': 0, 'txt': 1, 'docx': 2, 'pdf': 3}
+
+# Number of documents read ahead when a folder holds several PDF/DOCX files
+PREFETCH_WORKERS = 4
+
+def _iter_files(root):
+    """
+    Yield a DirEntry for every file under root, in the same top-down order as
+    os.walk, reusing scandir's cached entry type instead of stat-ing each path.
+    """
+    stack = [root]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    else:
+                        yield entry
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+def map_text_file(path):
+    """
+    Memory-map a .md/.txt file read-only so it can be scanned as bytes.
+
+    Returns a one-element tuple holding the map (or an empty tuple for an
+    empty or unreadable file), matching the other readers' iterable-of-chunks
+    shape. The map is released once the last reference to it is dropped.
+    """
+    try:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ()
+            return (mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ),)
+    except (OSError, ValueError):
+        return ()
+
+def _as_text(value):
+    """Decode a regex group taken from a bytes scan; str groups pass through."""
+    if isinstance(value, str):
+        return value
+    return value.decode('utf-8', errors='ignore')
+
+def pdf_may_contain_text(data):
+    """
+    Cheaply check whether a PDF's bytes could hold any extractable text.
+
+    Text can only be drawn with a font, so a file with no /Font resource
+    (typically a scanned, image-only PDF) is skipped without decoding its
+    page streams. Resources hidden inside compressed object streams
+    (/ObjStm) cannot be seen this way, so those files are always parsed.
+    """
+    return data.find(b'/Font') != -1 or data.find(b'/ObjStm') != -1
+
+def iter_pdf_pages(data):
+    """
+    Yield the text of each page of a PDF, given its bytes, using PyPDF2.
+
+    Only the raw text is needed to find links, so this skips the per-page
+    layout analysis that pdfplumber performs. pdfminer's raw text device
+    (laparams=None) is not used either: without layout analysis it emits no
+    line breaks or inter-word spaces, so a URL would run into the following
+    text. PyPDF2's plain extraction keeps those boundaries. Pages are decoded
+    lazily so the caller can stop once it has what it needs.
+    """
+    if not pdf_may_contain_text(data):
+        return
     try:
-        with pdfplumber.open(path) as pdf:
-            for page in pdf.pages:
-                txt = page.extract_text()
-                if txt:
-                    texts.append(txt)
+        reader = _pdf_reader()(io.BytesIO(data))
+        for page in reader.pages:
+            txt = page.extract_text()
+            if txt:
+                yield txt
     except Exception:
         pass
-    return "\n".join(texts)
 
-def extract_text_from_docx(path):
-    """Extract all text from a .docx file using python-docx."""
-    texts = []
+def extract_text_from_docx(source):
+    """
+    Extract the text of a .docx file (a path or binary file object) straight
+    from its XML.
+
+    Reads word/document.xml from the zip archive and joins the <w:t> run text
+    python-docx would (plus table and hyperlink text), with XML entities
+    decoded and paragraph ends, breaks and tabs turned into line breaks. Runs
+    are joined before any substring check because Word may split a URL
+    across several of them.
+    """
     try:
-        doc = Document(path)
-        for para in doc.paragraphs:
-            if para.text:
-                texts.append(para.text)
+        with zipfile.ZipFile(source) as docx:
+            xml = docx.read('word/document.xml').decode('utf-8', errors='ignore')
     except Exception:
-        pass
-    return "\n".join(texts)
+        return ''
+    return ''.join(
+        '\n' if m.group(1) is None else html.unescape(m.group(1))
+        for m in DOCX_TEXT_REGEX.finditer(xml)
+    )
+
+def _cache_file_for(cache_dir, data):
+    """Return the cache entry for a document, keyed by the SHA-1 of its contents."""
+    return Path(cache_dir) / f"{hashlib.sha1(data).hexdigest()}.txt"
 
-def find_links_in_tree(root, use_ssh=False):
+def _write_cache(texts, cache_file):
+    """
+    Save a document's text chunks to cache_file. The cache only saves work on
+    later runs, so an unwritable or full cache directory is ignored.
+    """
+    tmp_name = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent workers never see a partial entry
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=cache_file.parent,
+                                         suffix='.tmp', delete=False) as tmp:
+            tmp_name = tmp.name
+            tmp.write("\n".join(texts))
+        os.replace(tmp_name, cache_file)
+    except OSError:
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+def open_text_chunks(ext, path, cache_dir=None):
+    """
+    Return an iterable of text chunks from the reader for this document type.
+
+    When cache_dir is given, text extracted from PDF/DOCX files is stored
+    there and reused on later runs for files with identical contents.
+    """
+    if ext not in ('pdf', 'docx'):
+        return map_text_file(path)
+
+    # Read the file once; the same bytes feed the cache key, the PDF
+    # prescreen and the parser. A DOCX without a cache is opened directly so
+    # zipfile only reads the member it needs.
+    data = None
+    if ext == 'pdf' or cache_dir is not None:
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return ()
+
+    cache_file = None
+    if cache_dir is not None:
+        cache_file = _cache_file_for(cache_dir, data)
+        try:
+            if cache_file.exists():
+                return (cache_file.read_text(encoding='utf-8'),)
+        except OSError:
+            cache_file = None
+
+    if ext == 'pdf':
+        # PDFs are decoded a page at a time
+        chunks = iter_pdf_pages(data)
+    else:
+        chunks = (extract_text_from_docx(path if data is None else io.BytesIO(data)),)
+
+    if cache_file is None:
+        return chunks
+
+    # A cache entry must hold the whole document, so extract every page now
+    # rather than stopping at the first page with both links
+    texts = [_as_text(text) for text in chunks]
+    _write_cache(texts, cache_file)
+    return texts
+
+def _read_text_chunks(ext, path, cache_dir=None):
+    """Thread-pool worker: fully read one document into a list of text chunks."""
+    return list(open_text_chunks(ext, path, cache_dir))
+
+# Read-ahead thread pool, created on first use and then shared by every
+# student folder handled in the same (worker) process
+_prefetch_executor = None
+
+def _get_prefetch_executor():
+    """Return this process's document read-ahead pool, creating it if needed."""
+    global _prefetch_executor
+    if _prefetch_executor is None:
+        _prefetch_executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS)
+    return _prefetch_executor
+
+def _prefetch_text_chunks(documents, cache_dir=None, max_workers=PREFETCH_WORKERS):
+    """
+    Yield each document's text chunks in order while up to max_workers of the
+    following documents are read on the shared thread pool. Reads that have
+    not started are cancelled once the caller stops iterating.
+    """
+    executor = _get_prefetch_executor()
+    pending = deque()
+    try:
+        for ext, path in documents:
+            pending.append(executor.submit(_read_text_chunks, ext, path, cache_dir))
+            if len(pending) > max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+def find_links_in_tree(root, use_ssh=False, cache_dir=None):
     owner = None
     repo = None
     netlify = None
 
-    for dirpath, _, filenames in os.walk(root):
-        for fname in filenames:
-            lname = fname.lower()
-            if not lname.endswith(('.md', '.txt', '.pdf', '.docx')):
-                continue
-
-            fullpath = os.path.join(dirpath, fname)
-            # load lines from the appropriate reader
-            if lname.endswith('.pdf'):
-                text = extract_text_from_pdf(fullpath)
-                lines = text.splitlines()
-            elif lname.endswith('.docx'):
-                text = extract_text_from_docx(fullpath)
-                lines = text.splitlines()
-            else:
-                with open(fullpath, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-
-            for line in lines:
+    # Bind the compiled matchers locally; they run once per text chunk in the loop below
+    github_search, github_search_bytes = GITHUB_REGEX.search, GITHUB_REGEX_BYTES.search
+    netlify_search, netlify_search_bytes = RAW_NETLIFY_REGEX.search, RAW_NETLIFY_REGEX_BYTES.search
+    clean_netlify_search = CLEAN_NETLIFY_REGEX.search
+
+    candidates = []
+    for entry in _iter_files(root):
+        _, dot, ext = entry.name.lower().rpartition('.')
+        priority = LINK_FILE_PRIORITY.get(ext) if dot else None
+        if priority is None:
+            continue
+        try:
+            size = entry.stat().st_size
+        except OSError:
+            size = 0
+        candidates.append((priority, size, ext, entry.path))
+
+    # Cheapest documents first; the sort is stable, so ties keep walk order
+    candidates.sort(key=lambda candidate: candidate[:2])
+    documents = [(ext, path) for _, _, ext, path in candidates]
+
+    # Read several PDF/DOCX files concurrently; otherwise keep streaming lazily
+    # so a single PDF can still stop after the page holding the links
+    if sum(ext in ('pdf', 'docx') for ext, _ in documents) > 1:
+        document_chunks = _prefetch_text_chunks(documents, cache_dir)
+    else:
+        document_chunks = (open_text_chunks(ext, path, cache_dir) for ext, path in documents)
+
+    try:
+        for chunks in document_chunks:
+            # Neither pattern can match across a line break, so one search over
+            # each chunk finds the same first hit as a line-by-line scan.
+            for text in chunks:
+                if isinstance(text, str):
+                    search_github, search_netlify = github_search, netlify_search
+                    github_marker, netlify_marker, newline = GITHUB_MARKER, NETLIFY_MARKER, '\n'
+                else:
+                    search_github, search_netlify = github_search_bytes, netlify_search_bytes
+                    github_marker, netlify_marker, newline = GITHUB_MARKER_BYTES, NETLIFY_MARKER_BYTES, b'\n'
+
+                # Every match contains its marker and no match spans a line break,
+                # so each search starts on the line holding the first marker rather
+                # than rescanning the marker-free text before it. find() works on
+                # str, bytes and mmap alike and is far cheaper than a regex pass.
+
                 # GitHub
                 if owner is None:
-                    m = GITHUB_REGEX.search(line)
-                    if m:
-                        owner = m.group('owner')
-                        repo  = m.group('repo')
+                    position = text.find(github_marker)
+                    if position != -1:
+                        m = search_github(text, text.rfind(newline, 0, position) + 1)
+                        if m:
+                            owner = _as_text(m.group('owner'))
+                            repo  = _as_text(m.group('repo'))
 
                 # Netlify
                 if netlify is None:
-                    raw = RAW_NETLIFY_REGEX.search(line)
-                    if raw:
-                        candidate = raw.group(0).strip()
-                        clean = CLEAN_NETLIFY_REGEX.search(candidate)
-                        if clean:
-                            netlify = clean.group(0)
+                    position = text.find(netlify_marker)
+                    if position != -1:
+                        m = search_netlify(text, text.rfind(newline, 0, position) + 1)
+                        if m:
+                            candidate = _as_text(m.group(0)).strip()
+                            clean = clean_netlify_search(candidate)
+                            if clean:
+                                netlify = clean.group(0)
 
+                # Skip decoding the remaining pages
                 if owner and netlify:
                     break
 
+            # Stop before opening (and possibly parsing) another document
             if owner and netlify:
                 break
-        if owner and netlify:
-            break
+    finally:
+        document_chunks.close()
 
     # build GitHub URL
     if owner and repo:
@@ -122,27 +380,32 @@ def find_links_in_tree(root, use_ssh=False):
 
     return owner, github_url, netlify
 
-def traverse_and_extract(root_dir, csv_path, use_ssh=False):
-    rows = []
+def _extract_student_row(task):
+    """
+    Process-pool worker: find the links for one student folder and build its
+    CSV row as a (student, username, github, netlify) tuple.
+    """
+    entry, student_dir, use_ssh, cache_dir = task
+    owner, github, netlify = find_links_in_tree(student_dir, use_ssh, cache_dir)
+    return (entry, owner or 'none', github or 'none', netlify or 'none')
+
+def traverse_and_extract(root_dir, csv_path, use_ssh=False, cache_dir=None):
+    tasks = []
     for entry in sorted(os.listdir(root_dir)):
         student_dir = os.path.join(root_dir, entry)
         if not os.path.isdir(student_dir):
             continue
+        tasks.append((entry, student_dir, use_ssh, cache_dir))
 
-        owner, github, netlify = find_links_in_tree(student_dir, use_ssh)
-        rows.append({
-            'student':  entry,
-            'username': owner   or 'none',
-            'github':   github  or 'none',
-            'netlify':  netlify or 'none'
-        })
+    # Student folders are independent, so parse them in parallel; map() keeps entry order
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        rows = list(executor.map(_extract_student_row, tasks, chunksize=4))
 
     with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
         fieldnames = ['student', 'username', 'github', 'netlify']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
 
     print(f"Extracted {len(rows)} student entries to {csv_path}")
 
@@ -152,6 +415,8 @@ def main():
     )
     parser.add_argument('--ssh', action='store_true',
                         help="Output GitHub URLs in SSH form (git@github.com:owner/repo.git)")
+    parser.add_argument('--cache-dir', default=None,
+                        help="Directory to cache text extracted from PDF/DOCX files between runs")
     parser.add_argument('root_dir', help="Root directory containing student-number folders")
     parser.add_argument('output_csv', help="CSV file to write results to")
     args = parser.parse_args()
@@ -159,7 +424,7 @@ def main():
     if not os.path.isdir(args.root_dir):
         parser.error(f"{args.root_dir} is not a directory or does not exist.")
 
-    traverse_and_extract(args.root_dir, args.output_csv, use_ssh=args.ssh)
+    traverse_and_extract(args.root_dir, args.output_csv, use_ssh=args.ssh, cache_dir=args.cache_dir)
 
 if __name__ == '__main__':
     main()
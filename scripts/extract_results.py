@@ -1,100 +1,297 @@
-import re
+import regex as re
 import os
 import sys
 import argparse
 from pathlib import Path
+from functools import partial
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+# Patterns for the scores in a final assessment report, compiled once at import.
+# The *_PERFORMANCE patterns capture Points in groups 4-5 when present, and
+# otherwise still match the Performance Level range for the midpoint fallback.
+# Where a pattern reads a level and then a score further on, the part up to the
+# first level is an atomic group: if no score follows that level, none follows
+# a later one either, so the engine gives up instead of retrying every later
+# level line and rescanning to the end of the report from each. The patterns
+# are compiled with the regex package (a drop-in for re), which supports atomic
+# groups on every Python version and matches these patterns faster.
+SITE_PERFORMANCE_REGEX = re.compile(r"(?>Site Interactivity and Performance.*?\n\*\*Performance Level:\*\*\s*(\w+)\s*\((\d+)-(\d+)%\)).*?\*\*Points:\*\*\s*([\d.]+)/([\d.]+)\s*\(([\d.]+)%\)", re.DOTALL)
+RESPONSIVE_DESIGN_REGEX = re.compile(r"(?>### Responsive Design \(Mobile-First\).*?\n\*\*Performance Level:\*\*\s*(\w+)\s*\((\d+)-(\d+)%\)).*?\n\*\*Score:\*\*\s*([\d.]+)/([\d.]+)\s*points\s*\(([\d.]+)%\)", re.DOTALL)
+FLEXBOX_GRID_REGEX = re.compile(r"(?>CSS Responsiveness Features:.*?Flexbox Features:\s*(\d+)).*?Grid Features:\s*(\d+)", re.DOTALL)
+TOTAL_DESIGN_REGEX = re.compile(r"### Total Design & Responsiveness Score.*?\n\*\*Score:\*\*\s*([\d.]+)/([\d.]+)\s*points\s*\(([\d.]+)%\)", re.DOTALL)
+
+ACCESSIBILITY_REGEX = re.compile(r"Average Accessibility Score:\s*([\d.]+)/([\d.]+)")
+WCAG_SCORE_REGEX = re.compile(r"WCAG 2\.1 AA Compliance Score:\s*(\d+)/(\d+)")
+WCAG_PERFORMANCE_REGEX = re.compile(r"### WCAG 2\.1 AA Compliance.*?\n\*\*Performance Level:\*\*\s*(\w+)\s*\((\d+)-(\d+)%\)(?:.*?\n\*\*Points:\*\*\s*([\d.]+)/([\d.]+))?", re.DOTALL)
+SEMANTIC_PERFORMANCE_REGEX = re.compile(r"### Proper Semantic Tags and ARIA Attributes.*?\n\*\*Performance Level:\*\*\s*(\w+)\s*\((\d+)-(\d+)%\)(?:.*?\*\*Points:\*\*\s*([\d.]+)/([\d.]+))?", re.DOTALL)
+NAV_PERFORMANCE_REGEX = re.compile(r"### Accessible Navigation and Content.*?\n\*\*Performance Level:\*\*\s*(\w+)\s*\((\d+)-(\d+)%\)(?:.*?\*\*Points:\*\*\s*([\d.]+)/([\d.]+))?", re.DOTALL)
+
+AI_SCORES_REGEX = re.compile(r"\*\*Average\*\*\s*\|\s*-\s*\|\s*([\d.]+)/(\d+)\s*\|\s*([\d.]+)/(\d+)\s*\|\s*([\d.]+)/(\d+)\s*\|\s*([\d.]+)/(\d+)\s*\|\s*([\d.]+)/(\d+)\s*\|")
+CODE_QUALITY_REGEX = re.compile(r"\*\*Assessment:\*\*\s*([\d.]+)/([\d.]+)\s*points\s*\(([\d.]+)%\)")
+CODE_VALIDATION_REGEX = re.compile(r"\*\*Code Organisation and Documentation.*\n\*\*Score:\*\*\s*([\d.]+)/([\d.]+)\s*\((\w+)\s*\((\d+)-(\d+)%\)\)")
+
+VERSION_CONTROL_OVERALL_REGEX = re.compile(r"\*\*Overall Version Control\*\*\s*\|\s*\*\*([\d.]+)/([\d.]+)\*\*\s*\|\s*\*\*(\w+)\*\*\s*\|")
+COMMIT_FREQUENCY_REGEX = re.compile(r"(?>### Commit Frequency and Distribution.*?\*\*Performance Level:\*\*\s*(\w+)\s*\((\d+)-(\d+)%\)).*?\*\*Points:\*\*\s*([\d.]+)/([\d.]+)", re.DOTALL)
+COMMIT_MESSAGES_REGEX = re.compile(r"(?>### Quality of Commit Messages.*?\*\*Performance Level:\*\*\s*(\w+)\s*\((\d+)-(\d+)%\)).*?\*\*Points:\*\*\s*([\d.]+)/([\d.]+)", re.DOTALL)
+REPO_ORGANISATION_REGEX = re.compile(r"(?>### Repository Organisation.*?\*\*Performance Level:\*\*\s*(\w+)\s*\((\d+)-(\d+)%\)).*?\*\*Points:\*\*\s*([\d.]+)/([\d.]+)", re.DOTALL)
+DEPLOYMENT_REGEX = re.compile(r"### Correct deployment using GitHub and Netlify.*?\*\*Points:\*\*\s*([\d.]+)/([\d.]+)", re.DOTALL)
+OPTIONAL_BONUS_REGEX = re.compile(r"## Optional Bonus.*?\*\*Points:\*\*\s*([\d.]+)/([\d.]+)", re.DOTALL)
+
+# Literal text each score pattern above starts with. A pattern can only match
+# from an occurrence of its anchor, so it is searched from the anchor's first
+# offset, and not at all when the anchor is missing from the report.
+REPORT_ANCHORS = {
+    'site_performance': "Site Interactivity and Performance",
+    'responsive_design': "### Responsive Design (Mobile-First)",
+    'flexbox_grid': "CSS Responsiveness Features:",
+    'total_design': "### Total Design & Responsiveness Score",
+    'accessibility': "Average Accessibility Score:",
+    'wcag_score': "WCAG 2.1 AA Compliance Score:",
+    'wcag_performance': "### WCAG 2.1 AA Compliance",
+    'semantic': "### Proper Semantic Tags and ARIA Attributes",
+    'nav': "### Accessible Navigation and Content",
+    'ai_scores': "**Average**",
+    'code_quality': "**Assessment:**",
+    'code_validation': "**Code Organisation and Documentation",
+    'version_control_overall': "**Overall Version Control**",
+    'commit_frequency': "### Commit Frequency and Distribution",
+    'commit_messages': "### Quality of Commit Messages",
+    'repo_organisation': "### Repository Organisation",
+    'deployment': "### Correct deployment using GitHub and Netlify",
+    'optional_bonus': "## Optional Bonus",
+}
+
+# Rubric sections and subcategories with their assessment status, copied
+# fresh for each report by new_results()
+RESULTS_TEMPLATE = {
+    "Final Product & Technical Functionality (25%)": {
+        "covered": "Partially",
+        "assessment_type": "Performance analysis provided, embedded projects require manual review",
+        "score": "", # Section score will be left blank as per request
+        "subcategories": {
+            "Fully functional embedded projects (15%)": {"score": "", "status": "Requires manual review"},
+            "Overall site interactivity and performance (10%)": {"score": "", "status": "Complete assessment"}
+        }
+    },
+    "Design & Responsiveness (15%)": {
+        "covered": "Partially",
+        "assessment_type": "Responsive Design and Flexbox/Grid assessment provided. Color scheme and typography require manual review.",
+        "score": "", # Section score will be left blank as per request
+        "subcategories": {
+            "Responsive design (mobile-first) (7%)": {"score": "", "status": "Complete assessment"},
+            "Effective use of Flexbox/Grid (4%)": {"score": "", "status": "Complete assessment"},
+            "Cohesive color scheme and typography (4%)": {"score": "", "status": "Requires manual review"}
+        }
+    },
+    "Accessibility & Semantic HTML (10%)": {
+        "covered": "Yes",
+        "assessment_type": "Complete assessment provided",
+        "score": "", # Section score will be left blank as per request
+        "subcategories": {
+            "Compliance with WCAG 2.1 AA standards (5%)": {"score": "", "status": "Complete assessment"},
+            "Proper semantic tags and ARIA attributes (3%)": {"score": "", "status": "Complete assessment"},
+            "Accessible navigation and content (2%)": {"score": "", "status": "Complete assessment"}
+        }
+    },
+    "AI Integration & Critical Interaction (20%)": {
+        "covered": "Yes",
+        "assessment_type": "Complete assessment provided",
+        "score": "", # Section score will be left blank as per request
+        "subcategories": {
+            "Depth and relevance of AI interactions (5%)": {"score": "", "status": "Complete assessment"},
+            "Prompt engineering evolution (5%)": {"score": "", "status": "Complete assessment"},
+            "Critical evaluation of AI-generated output (5%)": {"score": "", "status": "Complete assessment"},
+            "Implementation improvements beyond AI suggestions (5%)": {"score": "", "status": "Complete assessment"}
+        }
+    },
+    "Development Process (10%)": {
+        "covered": "Partially",
+        "assessment_type": "Only Code organisation assessment provided",
+        "score": "", # Section score will be left blank as per request
+        "subcategories": {
+            "Problem-solving approaches (5%)": {"score": "", "status": "No assessment provided"},
+            "Code organisation and documentation (5%)": {"score": "", "status": "Complete assessment"}
+        }
+    },
+    "Version Control (10%)": {
+        "covered": "Yes",
+        "assessment_type": "Complete assessment provided",
+        "score": "", # Section score will be left blank as per request
+        "subcategories": {
+            "Commit frequency and distribution (3%)": {"score": "", "status": "Complete assessment"},
+            "Quality of commit messages (4%)": {"score": "", "status": "Complete assessment"},
+            "Repository organisation (3%)": {"score": "", "status": "Complete assessment"}
+        }
+    },
+    "Deployment (10%)": {
+        "covered": "Yes",
+        "assessment_type": "Complete assessment provided",
+        "score": "", # Section score will be left blank as per request
+        "subcategories": {
+            "Correct deployment using GitHub and Netlify (10%)": {"score": "", "status": "Complete assessment"}
+        }
+    },
+    "Optional Bonus (up to 5%)": {
+        "covered": "No",
+        "assessment_type": "No assessment provided",
+        "score": "", # Section score will be left blank as per request
+        "subcategories": {
+            "Quality and depth of code review and improvement roadmap": {"score": "", "status": "No assessment provided"}
+        }
+    }
+}
+
+# Trailing weight such as " (15%)" on rubric section and subcategory names
+PERCENT_SUFFIX_REGEX = re.compile(r"\s*\(\d+%\)")
+
+# The markdown table's fixed text, rendered once at import: the header, each
+# section row (its score column is always blank) and each subcategory row up to its score
+MARKDOWN_HEADER = "| Rubric Section | Score |\n|----------------|-------|\n"
+MARKDOWN_SECTION_ROWS = {section: f"| **{section}** | |\n" for section in RESULTS_TEMPLATE}
+MARKDOWN_SUBCAT_PREFIXES = {
+    subcat: f"| - {subcat} | "
+    for data in RESULTS_TEMPLATE.values()
+    for subcat in data["subcategories"]
+}
+
+# Column widths of the ASCII table
+ASCII_SECTION_WIDTH = 45
+ASCII_SCORE_WIDTH = 15
+
+# The ASCII table's fixed text, rendered once at import with the weight stripped
+# from every name: each section row (its score column is always blank, so the
+# row ends at the separator) and each subcategory row up to its score
+ASCII_SECTION_ROWS = {
+    section: PERCENT_SUFFIX_REGEX.sub("", section).ljust(ASCII_SECTION_WIDTH) + " |\n"
+    for section in RESULTS_TEMPLATE
+}
+ASCII_SUBCAT_PREFIXES = {
+    subcat: "  - " + PERCENT_SUFFIX_REGEX.sub("", subcat).ljust(ASCII_SECTION_WIDTH - 4) + " | "
+    for data in RESULTS_TEMPLATE.values()
+    for subcat in data["subcategories"]
+}
+
+def midpoint_score(min_range, max_range, max_points):
+    """
+    Score out of max_points for the midpoint of a percentage range, rounded to
+    the nearest 0.5 with ties to even, exactly as round() on the float did
+    """
+    # Twice the score is (min + max) / 2 / 100 * max_points * 2; round it in integers
+    doubled, remainder = divmod((int(min_range) + int(max_range)) * max_points, 100)
+    if remainder > 50 or (remainder == 50 and doubled % 2):
+        doubled += 1
+    return doubled / 2
+
+# Flexbox/Grid score out of 4 for each minimum number of layout features: the
+# midpoint of the matching performance level range, rounded to the nearest 0.5
+FLEXBOX_GRID_SCORES = tuple(
+    (min_features, midpoint_score(min_range, max_range, 4))
+    for min_features, min_range, max_range in ((10, 65, 74), (5, 50, 64), (0, 0, 49))
+)
+
+def performance_score(match, max_points):
+    """
+    Score a *_PERFORMANCE match out of max_points: the captured Points as
+    "x/max_points" if present, otherwise the midpoint of the Performance Level
+    range scaled to max_points and rounded to the nearest 0.5
+    """
+    score_points = match.group(4)
+    if score_points is not None:
+        return score_points + "/" + str(max_points)
+
+    # Fallback to midpoint calculation if points not explicitly found
+    numeric_score = midpoint_score(match.group(2), match.group(3), max_points)
+    return str(numeric_score)
+
+def new_results():
+    """Return a fresh, unscored copy of RESULTS_TEMPLATE"""
+    return {
+        section: {
+            "covered": data["covered"],
+            "assessment_type": data["assessment_type"],
+            "score": "",
+            "subcategories": {
+                subcat: {"score": "", "status": subdata["status"]}
+                for subcat, subdata in data["subcategories"].items()
+            },
+        }
+        for section, data in RESULTS_TEMPLATE.items()
+    }
 
-def midpoint_percentage(min_range, max_range):
-    """Calculate the midpoint percentage of a range, rounded to nearest 0.5"""
-    midpoint = (float(min_range) + float(max_range)) / 2
-    # Round to nearest 0.5
-    return round(midpoint * 2) / 2
+def find_anchors(content):
+    """Return the offset of the first occurrence of each report anchor found in content"""
+    anchors = {}
+    for key, text in REPORT_ANCHORS.items():
+        start = content.find(text)
+        if start != -1:
+            anchors[key] = start
+    return anchors
+
+def search_from_anchor(pattern, content, anchors, key):
+    """Search for pattern starting at its anchor, or return None if the anchor is absent"""
+    start = anchors.get(key)
+    if start is None:
+        return None
+    return pattern.search(content, start)
+
+def match_on_anchor_line(pattern, content, anchors, key):
+    """
+    Match a single-line pattern against the line holding each occurrence of its
+    anchor in turn, returning the first match, or None if no line matches
+    """
+    anchor = REPORT_ANCHORS[key]
+    start = anchors.get(key, -1)
+    while start != -1:
+        end = content.find("\n", start)
+        if end == -1:
+            end = len(content)
+        match = pattern.match(content, start, end)
+        if match:
+            return match
+        start = content.find(anchor, start + 1)
+    return None
+
+# Subcategory scores copied straight from a report's points capture as "<score>/<max points>".
+# Applied in order, so the Code Quality Validation score overrides the Code Organisation one.
+PointsExtractor = namedtuple("PointsExtractor", "key pattern locate group section subcategory max_points")
+POINTS_EXTRACTORS = (
+    PointsExtractor('code_quality', CODE_QUALITY_REGEX, match_on_anchor_line, 1,
+                    "Development Process (10%)", "Code organisation and documentation (5%)", 5),
+    PointsExtractor('code_validation', CODE_VALIDATION_REGEX, search_from_anchor, 1,
+                    "Development Process (10%)", "Code organisation and documentation (5%)", 5),
+    PointsExtractor('commit_frequency', COMMIT_FREQUENCY_REGEX, search_from_anchor, 4,
+                    "Version Control (10%)", "Commit frequency and distribution (3%)", 3),
+    PointsExtractor('commit_messages', COMMIT_MESSAGES_REGEX, search_from_anchor, 4,
+                    "Version Control (10%)", "Quality of commit messages (4%)", 4),
+    PointsExtractor('repo_organisation', REPO_ORGANISATION_REGEX, search_from_anchor, 4,
+                    "Version Control (10%)", "Repository organisation (3%)", 3),
+    PointsExtractor('deployment', DEPLOYMENT_REGEX, search_from_anchor, 1,
+                    "Deployment (10%)", "Correct deployment using GitHub and Netlify (10%)", 10),
+)
 
 def extract_results_from_report(file_path):
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content = file.read()
+    content = Path(file_path).read_text(encoding='utf-8')
+
+    # Locate every score's anchor text up front
+    anchors = find_anchors(content)
 
     # Create a dictionary to store results with subcategories and assessment status
-    results = {
-        "Final Product & Technical Functionality (25%)": {
-            "covered": "Partially",
-            "assessment_type": "Performance analysis provided, embedded projects require manual review",
-            "score": "", # Section score will be left blank as per request
-            "subcategories": {
-                "Fully functional embedded projects (15%)": {"score": "", "status": "Requires manual review"},
-                "Overall site interactivity and performance (10%)": {"score": "", "status": "Complete assessment"}
-            }
-        },
-        "Design & Responsiveness (15%)": {
-            "covered": "Partially",
-            "assessment_type": "Responsive Design and Flexbox/Grid assessment provided. Color scheme and typography require manual review.",
-            "score": "", # Section score will be left blank as per request
-            "subcategories": {
-                "Responsive design (mobile-first) (7%)": {"score": "", "status": "Complete assessment"},
-                "Effective use of Flexbox/Grid (4%)": {"score": "", "status": "Complete assessment"},
-                "Cohesive color scheme and typography (4%)": {"score": "", "status": "Requires manual review"}
-            }
-        },
-        "Accessibility & Semantic HTML (10%)": {
-            "covered": "Yes",
-            "assessment_type": "Complete assessment provided",
-            "score": "", # Section score will be left blank as per request
-            "subcategories": {
-                "Compliance with WCAG 2.1 AA standards (5%)": {"score": "", "status": "Complete assessment"},
-                "Proper semantic tags and ARIA attributes (3%)": {"score": "", "status": "Complete assessment"},
-                "Accessible navigation and content (2%)": {"score": "", "status": "Complete assessment"}
-            }
-        },
-        "AI Integration & Critical Interaction (20%)": {
-            "covered": "Yes",
-            "assessment_type": "Complete assessment provided",
-            "score": "", # Section score will be left blank as per request
-            "subcategories": {
-                "Depth and relevance of AI interactions (5%)": {"score": "", "status": "Complete assessment"},
-                "Prompt engineering evolution (5%)": {"score": "", "status": "Complete assessment"},
-                "Critical evaluation of AI-generated output (5%)": {"score": "", "status": "Complete assessment"},
-                "Implementation improvements beyond AI suggestions (5%)": {"score": "", "status": "Complete assessment"}
-            }
-        },
-        "Development Process (10%)": {
-            "covered": "Partially",
-            "assessment_type": "Only Code organisation assessment provided",
-            "score": "", # Section score will be left blank as per request
-            "subcategories": {
-                "Problem-solving approaches (5%)": {"score": "", "status": "No assessment provided"},
-                "Code organisation and documentation (5%)": {"score": "", "status": "Complete assessment"}
-            }
-        },
-        "Version Control (10%)": {
-            "covered": "Yes",
-            "assessment_type": "Complete assessment provided",
-            "score": "", # Section score will be left blank as per request
-            "subcategories": {
-                "Commit frequency and distribution (3%)": {"score": "", "status": "Complete assessment"},
-                "Quality of commit messages (4%)": {"score": "", "status": "Complete assessment"},
-                "Repository organisation (3%)": {"score": "", "status": "Complete assessment"}
-            }
-        },
-        "Deployment (10%)": {
-            "covered": "Yes",
-            "assessment_type": "Complete assessment provided",
-            "score": "", # Section score will be left blank as per request
-            "subcategories": {
-                "Correct deployment using GitHub and Netlify (10%)": {"score": "", "status": "Complete assessment"}
-            }
-        },
-        "Optional Bonus (up to 5%)": {
-            "covered": "No",
-            "assessment_type": "No assessment provided",
-            "score": "", # Section score will be left blank as per request
-            "subcategories": {
-                "Quality and depth of code review and improvement roadmap": {"score": "", "status": "No assessment provided"}
-            }
-        }
-    }
+    results = new_results()
+
+    # A report holding none of the anchors (empty or truncated) has nothing to extract
+    if not anchors:
+        return results
+
+    # Bind each section's subcategories once for the score assignments below
+    final_product = results["Final Product & Technical Functionality (25%)"]["subcategories"]
+    design = results["Design & Responsiveness (15%)"]["subcategories"]
+    accessibility = results["Accessibility & Semantic HTML (10%)"]["subcategories"]
+    ai_integration = results["AI Integration & Critical Interaction (20%)"]["subcategories"]
+    optional_bonus = results["Optional Bonus (up to 5%)"]["subcategories"]
 
     # Extract Site Interactivity and Performance score
-    site_performance_match = re.search(r"Site Interactivity and Performance.*?\n\*\*Performance Level:\*\*\s*(\w+)\s*\((\d+)-(\d+)%\).*?\*\*Points:\*\*\s*([\d.]+)/([\d.]+)\s*\(([\d.]+)%\)", content, re.DOTALL)
+    site_performance_match = search_from_anchor(SITE_PERFORMANCE_REGEX, content, anchors, 'site_performance')
     if site_performance_match:
         performance = site_performance_match.group(1)
         min_range = site_performance_match.group(2)
@@ -108,19 +305,18 @@ def extract_results_from_report(file_path):
             # If explicit score is provided, use it
             try:
                 numeric_score = float(score)
-                results["Final Product & Technical Functionality (25%)"]["subcategories"]["Overall site interactivity and performance (10%)"]["score"] = f"{numeric_score}"
+                final_product["Overall site interactivity and performance (10%)"]["score"] = str(numeric_score)
             except ValueError:
                 # Fallback to midpoint calculation
-                midpoint = midpoint_percentage(min_range, max_range)
-                numeric_score = round((midpoint / 100) * 10 * 2) / 2  # 10% criteria, rounded to nearest 0.5
-                results["Final Product & Technical Functionality (25%)"]["subcategories"]["Overall site interactivity and performance (10%)"]["score"] = f"{numeric_score}"
+                numeric_score = midpoint_score(min_range, max_range, 10)  # 10% criteria, rounded to nearest 0.5
+                final_product["Overall site interactivity and performance (10%)"]["score"] = str(numeric_score)
 
         # Section total is not needed as per new requirements
         # results["Final Product & Technical Functionality (25%)"]["score"] = f"{section_total}/25"
 
 
     # Extract Responsive Design score
-    responsive_design_match = re.search(r"### Responsive Design \(Mobile-First\).*?\n\*\*Performance Level:\*\*\s*(\w+)\s*\((\d+)-(\d+)%\).*?\n\*\*Score:\*\*\s*([\d.]+)/([\d.]+)\s*points\s*\(([\d.]+)%\)", content, re.DOTALL)
+    responsive_design_match = search_from_anchor(RESPONSIVE_DESIGN_REGEX, content, anchors, 'responsive_design')
     if responsive_design_match:
         performance = responsive_design_match.group(1)
         min_range = responsive_design_match.group(2)
@@ -133,38 +329,25 @@ def extract_results_from_report(file_path):
         if score:
             try:
                 numeric_score = float(score)
-                results["Design & Responsiveness (15%)"]["subcategories"]["Responsive design (mobile-first) (7%)"]["score"] = f"{numeric_score}"
+                design["Responsive design (mobile-first) (7%)"]["score"] = str(numeric_score)
             except ValueError:
                 # Fallback to midpoint calculation
-                midpoint = midpoint_percentage(min_range, max_range)
-                numeric_score = round((midpoint / 100) * 7 * 2) / 2  # 7% criteria, rounded to nearest 0.5
-                results["Design & Responsiveness (15%)"]["subcategories"]["Responsive design (mobile-first) (7%)"]["score"] = f"{numeric_score}"
+                numeric_score = midpoint_score(min_range, max_range, 7)  # 7% criteria, rounded to nearest 0.5
+                design["Responsive design (mobile-first) (7%)"]["score"] = str(numeric_score)
 
     # Extract Flexbox/Grid usage from CSS features
-    flexbox_grid_match = re.search(r"CSS Responsiveness Features:.*?Flexbox Features:\s*(\d+).*?Grid Features:\s*(\d+)", content, re.DOTALL)
+    flexbox_grid_match = search_from_anchor(FLEXBOX_GRID_REGEX, content, anchors, 'flexbox_grid')
     if flexbox_grid_match:
         flexbox_count = int(flexbox_grid_match.group(1))
         grid_count = int(flexbox_grid_match.group(2))
 
-        # Determine performance level based on feature count
+        # Score from the first tier whose feature count is reached
         total_layout_features = flexbox_count + grid_count
-        if total_layout_features >= 10:
-            min_range = "65"
-            max_range = "74"
-        elif total_layout_features >= 5:
-            min_range = "50"
-            max_range = "64"
-        else:
-            min_range = "0"
-            max_range = "49"
-
-        # Calculate the midpoint score
-        midpoint = midpoint_percentage(min_range, max_range)
-        numeric_score = round((midpoint / 100) * 4 * 2) / 2  # 4% criteria, rounded to nearest 0.5
-        results["Design & Responsiveness (15%)"]["subcategories"]["Effective use of Flexbox/Grid (4%)"]["score"] = f"{numeric_score}"
+        numeric_score = next(score for min_features, score in FLEXBOX_GRID_SCORES if total_layout_features >= min_features)
+        design["Effective use of Flexbox/Grid (4%)"]["score"] = str(numeric_score)
 
     # Extract Overall Design & Responsiveness score
-    total_design_match = re.search(r"### Total Design & Responsiveness Score.*?\n\*\*Score:\*\*\s*([\d.]+)/([\d.]+)\s*points\s*\(([\d.]+)%\)", content, re.DOTALL)
+    total_design_match = search_from_anchor(TOTAL_DESIGN_REGEX, content, anchors, 'total_design')
     if total_design_match:
         score = total_design_match.group(1)
         total = total_design_match.group(2)
@@ -176,7 +359,7 @@ def extract_results_from_report(file_path):
 
 
     # Extract Accessibility & Semantic HTML scores
-    accessibility_match = re.search(r"Average Accessibility Score:\s*([\d.]+)/([\d.]+)", content)
+    accessibility_match = match_on_anchor_line(ACCESSIBILITY_REGEX, content, anchors, 'accessibility')
     if accessibility_match:
         score = accessibility_match.group(1)
         total = accessibility_match.group(2)
@@ -195,58 +378,25 @@ def extract_results_from_report(file_path):
 
 
     # Extract WCAG compliance score
-    wcag_match = re.search(r"WCAG 2\.1 AA Compliance Score:\s*(\d+)/(\d+)", content)
+    wcag_match = match_on_anchor_line(WCAG_SCORE_REGEX, content, anchors, 'wcag_score')
     if wcag_match:
         score = wcag_match.group(1)
         total = wcag_match.group(2)
 
         # Look for the WCAG performance level section specifically
-        wcag_perf_match = re.search(r"### WCAG 2\.1 AA Compliance.*?\n\*\*Performance Level:\*\*\s*(\w+)\s*\((\d+)-(\d+)%\).*?\n\*\*Points:\*\*\s*([\d.]+)/([\d.]+)", content, re.DOTALL) # Added Points capture
+        wcag_perf_match = search_from_anchor(WCAG_PERFORMANCE_REGEX, content, anchors, 'wcag_performance') # Points capture is optional
         if wcag_perf_match:
-            score_points = wcag_perf_match.group(4) # Capture points
-            results["Accessibility & Semantic HTML (10%)"]["subcategories"]["Compliance with WCAG 2.1 AA standards (5%)"]["score"] = f"{score_points}/5"
-        else: # Fallback to midpoint calculation if points not explicitly found
-            wcag_perf_match = re.search(r"### WCAG 2\.1 AA Compliance.*?\n\*\*Performance Level:\*\*\s*(\w+)\s*\((\d+)-(\d+)%\)", content, re.DOTALL)
-            if wcag_perf_match:
-                min_range = wcag_perf_match.group(2)
-                max_range = wcag_perf_match.group(3)
-
-                # Calculate actual score out of 5 (midpoint of range)
-                midpoint = midpoint_percentage(min_range, max_range)
-                numeric_score = round((midpoint / 100) * 5 * 2) / 2  # 5% criteria, rounded to nearest 0.5
-                results["Accessibility & Semantic HTML (10%)"]["subcategories"]["Compliance with WCAG 2.1 AA standards (5%)"]["score"] = f"{numeric_score}"
+            accessibility["Compliance with WCAG 2.1 AA standards (5%)"]["score"] = performance_score(wcag_perf_match, 5)
 
     # Extract semantic tags score
-    semantic_match = re.search(r"### Proper Semantic Tags and ARIA Attributes.*?\n\*\*Performance Level:\*\*\s*(\w+)\s*\((\d+)-(\d+)%\).*?\*\*Points:\*\*\s*([\d.]+)/([\d.]+)", content, re.DOTALL) # Added Points capture
+    semantic_match = search_from_anchor(SEMANTIC_PERFORMANCE_REGEX, content, anchors, 'semantic') # Points capture is optional
     if semantic_match:
-        score_points = semantic_match.group(4) # Capture points
-        results["Accessibility & Semantic HTML (10%)"]["subcategories"]["Proper semantic tags and ARIA attributes (3%)"]["score"] = f"{score_points}/3"
-    else: # Fallback to midpoint calculation if points not explicitly found
-        semantic_match = re.search(r"### Proper Semantic Tags and ARIA Attributes.*?\n\*\*Performance Level:\*\*\s*(\w+)\s*\((\d+)-(\d+)%\)", content, re.DOTALL)
-        if semantic_match:
-            min_range = semantic_match.group(2)
-            max_range = semantic_match.group(3)
-
-            # Calculate actual score out of 3 (midpoint of range)
-            midpoint = midpoint_percentage(min_range, max_range)
-            numeric_score = round((midpoint / 100) * 3 * 2) / 2  # 3% criteria, rounded to nearest 0.5
-            results["Accessibility & Semantic HTML (10%)"]["subcategories"]["Proper semantic tags and ARIA attributes (3%)"]["score"] = f"{numeric_score}"
+        accessibility["Proper semantic tags and ARIA attributes (3%)"]["score"] = performance_score(semantic_match, 3)
 
     # Extract navigation accessibility score
-    nav_match = re.search(r"### Accessible Navigation and Content.*?\n\*\*Performance Level:\*\*\s*(\w+)\s*\((\d+)-(\d+)%\).*?\*\*Points:\*\*\s*([\d.]+)/([\d.]+)", content, re.DOTALL) # Added Points capture
+    nav_match = search_from_anchor(NAV_PERFORMANCE_REGEX, content, anchors, 'nav') # Points capture is optional
     if nav_match:
-        score_points = nav_match.group(4) # Capture points
-        results["Accessibility & Semantic HTML (10%)"]["subcategories"]["Accessible navigation and content (2%)"]["score"] = f"{score_points}/2"
-    else: # Fallback to midpoint calculation if points not explicitly found
-        nav_match = re.search(r"### Accessible Navigation and Content.*?\n\*\*Performance Level:\*\*\s*(\w+)\s*\((\d+)-(\d+)%\)", content, re.DOTALL)
-        if nav_match:
-            min_range = nav_match.group(2)
-            max_range = nav_match.group(3)
-
-            # Calculate actual score out of 2 (midpoint of range)
-            midpoint = midpoint_percentage(min_range, max_range)
-            numeric_score = round((midpoint / 100) * 2 * 2) / 2  # 2% criteria, rounded to nearest 0.5
-            results["Accessibility & Semantic HTML (10%)"]["subcategories"]["Accessible navigation and content (2%)"]["score"] = f"{numeric_score}"
+        accessibility["Accessible navigation and content (2%)"]["score"] = performance_score(nav_match, 2)
 
     # Section total is not needed as per new requirements
     # if all([wcag_score, semantic_score, nav_score]):
@@ -263,7 +413,7 @@ def extract_results_from_report(file_path):
 
 
     # Extract AI Integration scores
-    ai_scores_match = re.search(r"\*\*Average\*\*\s*\|\s*-\s*\|\s*([\d.]+)/(\d+)\s*\|\s*([\d.]+)/(\d+)\s*\|\s*([\d.]+)/(\d+)\s*\|\s*([\d.]+)/(\d+)\s*\|\s*([\d.]+)/(\d+)\s*\|", content)
+    ai_scores_match = match_on_anchor_line(AI_SCORES_REGEX, content, anchors, 'ai_scores')
     if ai_scores_match:
         ai_interaction_score = ai_scores_match.group(1)
         prompt_engineering_score = ai_scores_match.group(3)
@@ -272,61 +422,27 @@ def extract_results_from_report(file_path):
         total_score = ai_scores_match.group(9)
 
         # Use the actual numeric scores directly for subcategories
-        results["AI Integration & Critical Interaction (20%)"]["subcategories"]["Depth and relevance of AI interactions (5%)"]["score"] = f"{ai_interaction_score}/5"
-        results["AI Integration & Critical Interaction (20%)"]["subcategories"]["Prompt engineering evolution (5%)"]["score"] = f"{prompt_engineering_score}/5"
-        results["AI Integration & Critical Interaction (20%)"]["subcategories"]["Critical evaluation of AI-generated output (5%)"]["score"] = f"{critical_evaluation_score}/5"
-        results["AI Integration & Critical Interaction (20%)"]["subcategories"]["Implementation improvements beyond AI suggestions (5%)"]["score"] = f"{implementation_score}/5"
+        ai_integration["Depth and relevance of AI interactions (5%)"]["score"] = ai_interaction_score + "/5"
+        ai_integration["Prompt engineering evolution (5%)"]["score"] = prompt_engineering_score + "/5"
+        ai_integration["Critical evaluation of AI-generated output (5%)"]["score"] = critical_evaluation_score + "/5"
+        ai_integration["Implementation improvements beyond AI suggestions (5%)"]["score"] = implementation_score + "/5"
         # Section total is not needed as per new requirements
         # results["AI Integration & Critical Interaction (20%)"]["score"] = f"{total_score}/20"
 
 
-    # Extract Code Organisation score
-    code_quality_match = re.search(r"\*\*Assessment:\*\*\s*([\d.]+)/([\d.]+)\s*points\s*\(([\d.]+)%\)", content)
-    if code_quality_match:
-        score = code_quality_match.group(1)
-        total = code_quality_match.group(2)
-
-        # Use the provided numeric score directly for the subcategory
-        results["Development Process (10%)"]["subcategories"]["Code organisation and documentation (5%)"]["score"] = f"{score}/5"
-        # Section total is not needed as per new requirements
-        # results["Development Process (10%)"]["score"] = f"{score}/10"
-
-    # Extract Code Quality Validation score (redundant with above if format is consistent, keeping for robustness)
-    validation_match = re.search(r"\*\*Code Organisation and Documentation.*\n\*\*Score:\*\*\s*([\d.]+)/([\d.]+)\s*\((\w+)\s*\((\d+)-(\d+)%\)\)", content)
-    if validation_match:
-        score = validation_match.group(1)
-        total = validation_match.group(2)
-
-        # If this match is found, it likely provides the definitive score for the subcategory
-        results["Development Process (10%)"]["subcategories"]["Code organisation and documentation (5%)"]["score"] = f"{score}/5"
-        # Section total is not needed as per new requirements
-        # results["Development Process (10%)"]["score"] = f"{score}/10"
-
-
     # Extract Version Control scores
-    version_control_overall_match = re.search(r"\*\*Overall Version Control\*\*\s*\|\s*\*\*([\d.]+)/([\d.]+)\*\*\s*\|\s*\*\*(\w+)\*\*\s*\|", content)
+    version_control_overall_match = match_on_anchor_line(VERSION_CONTROL_OVERALL_REGEX, content, anchors, 'version_control_overall')
     if version_control_overall_match:
         score = version_control_overall_match.group(1)
         # Section total is not needed as per new requirements
         # results["Version Control (10%)"]["score"] = f"{score}/10"
 
-    # Extract commit frequency score
-    commit_freq_match = re.search(r"### Commit Frequency and Distribution.*?\*\*Performance Level:\*\*\s*(\w+)\s*\((\d+)-(\d+)%\).*?\*\*Points:\*\*\s*([\d.]+)/([\d.]+)", content, re.DOTALL)
-    if commit_freq_match:
-        score = commit_freq_match.group(4)
-        results["Version Control (10%)"]["subcategories"]["Commit frequency and distribution (3%)"]["score"] = f"{score}/3"
-
-    # Extract commit messages quality score
-    commit_msg_match = re.search(r"### Quality of Commit Messages.*?\*\*Performance Level:\*\*\s*(\w+)\s*\((\d+)-(\d+)%\).*?\*\*Points:\*\*\s*([\d.]+)/([\d.]+)", content, re.DOTALL)
-    if commit_msg_match:
-        score = commit_msg_match.group(4)
-        results["Version Control (10%)"]["subcategories"]["Quality of commit messages (4%)"]["score"] = f"{score}/4"
-
-    # Extract repository organisation score
-    repo_org_match = re.search(r"### Repository Organisation.*?\*\*Performance Level:\*\*\s*(\w+)\s*\((\d+)-(\d+)%\).*?\*\*Points:\*\*\s*([\d.]+)/([\d.]+)", content, re.DOTALL)
-    if repo_org_match:
-        score = repo_org_match.group(4)
-        results["Version Control (10%)"]["subcategories"]["Repository organisation (3%)"]["score"] = f"{score}/3"
+    # Extract the Code Organisation, Version Control and Deployment points scores
+    for extractor in POINTS_EXTRACTORS:
+        match = extractor.locate(extractor.pattern, content, anchors, extractor.key)
+        if match:
+            subcategories = results[extractor.section]["subcategories"]
+            subcategories[extractor.subcategory]["score"] = match.group(extractor.group) + "/" + str(extractor.max_points)
 
     # Section total is not needed as per new requirements
     # commit_freq_score = results["Version Control (10%)"]["subcategories"]["Commit frequency and distribution (3%)"]["score"]
@@ -341,23 +457,15 @@ def extract_results_from_report(file_path):
     #         pass
 
 
-    # Extract Deployment score
-    deployment_match = re.search(r"### Correct deployment using GitHub and Netlify.*?\*\*Points:\*\*\s*([\d.]+)/([\d.]+)", content, re.DOTALL)
-    if deployment_match:
-        score = deployment_match.group(1)
-        # Section total is not needed as per new requirements
-        # results["Deployment (10%)"]["score"] = f"{score}/10"
-        results["Deployment (10%)"]["subcategories"]["Correct deployment using GitHub and Netlify (10%)"]["score"] = f"{score}/10"
-
     # Extract Optional Bonus score
-    optional_bonus_match = re.search(r"## Optional Bonus.*?\*\*Points:\*\*\s*([\d.]+)/([\d.]+)", content, re.DOTALL)
+    optional_bonus_match = search_from_anchor(OPTIONAL_BONUS_REGEX, content, anchors, 'optional_bonus')
     if optional_bonus_match:
         score = optional_bonus_match.group(1)
         # Section total is not needed as per new requirements
         # results["Optional Bonus (up to 5%)"]["score"] = f"{score}/5"
         # Optional bonus only has one subcategory listed in the initial structure
-        for subcat in results["Optional Bonus (up to 5%)"]["subcategories"]:
-            results["Optional Bonus (up to 5%)"]["subcategories"][subcat]["score"] = f"{score}/5"
+        for subdata in optional_bonus.values():
+            subdata["score"] = score + "/5"
 
 
     return results
@@ -366,68 +474,127 @@ def extract_results_from_report(file_path):
 # Removed calculate_total_score function as the summary section is removed
 
 def create_markdown_table(results, student_id): # Simplified argument is no longer needed
-    table = f"# Assessment Results for {student_id}\n\n"
+    # Collect the lines in a list and join them once at the end
+    parts = [f"# Assessment Results for {student_id}\n\n"]
 
     # Version with all subcategories included
-    table += "| Rubric Section | Score |\n"
-    table += "|----------------|-------|\n"
+    parts.append(MARKDOWN_HEADER)
 
     for section, data in results.items():
         # Add section row - Score column is intentionally blank
-        table += f"| **{section}** | |\n"
+        parts.append(MARKDOWN_SECTION_ROWS[section])
 
         # Add all subcategory rows
         for subcat, subdata in data['subcategories'].items():
-            # Display score if available, otherwise blank. Strip trailing whitespace from score.
-            score_display = subdata['score'].strip() if subdata['score'] else ""
-            table += f"| - {subcat} | {score_display} |\n"
+            # Display score if available, otherwise blank. Scores are built from regex
+            # number captures, so they never carry whitespace to strip.
+            score_display = subdata['score'] or ""
+            parts.append(MARKDOWN_SUBCAT_PREFIXES[subcat] + score_display + " |\n")
 
     # Removed the summary section
 
-    return table
+    return "".join(parts)
 
 def create_ascii_table(results, student_id):
     """Create an ASCII table with fixed-width columns for better alignment"""
 
     # Define column widths
-    section_width = 45
-    score_width = 15
+    section_width = ASCII_SECTION_WIDTH
+    score_width = ASCII_SCORE_WIDTH
 
     # Create header
-    header = f"Assessment Results for {student_id}\n"
-    header += "=" * (section_width + score_width + 3) + "\n\n"
+    parts = [f"Assessment Results for {student_id}\n"]
+    parts.append("=" * (section_width + score_width + 3) + "\n\n")
 
     # Create table structure
-    table = f"{'Rubric Section':{section_width}} | {'Score':{score_width}}\n"
-    table += "-" * section_width + "-+-" + "-" * score_width + "\n"
+    parts.append("Rubric Section".ljust(section_width) + " | " + "Score".ljust(score_width) + "\n")
+    parts.append("-" * section_width + "-+-" + "-" * score_width + "\n")
 
     # Add rows
     for section, data in results.items():
-        # Format section name to remove the percentage for cleaner display
-        section_name = re.sub(r"\s*\(\d+%\)", "", section)
-        # Add section row - Score column is intentionally blank, padded to width
-        table += f"{section_name:{section_width}} | {'':{score_width}}\n".rstrip() + "\n" # rstrip to remove potential trailing space
+        # Add section row - prerendered, as it has no per-student content
+        parts.append(ASCII_SECTION_ROWS[section])
 
-        # Add all subcategory rows
+        # Add all subcategory rows - prerendered up to the score
         for subcat, subdata in data['subcategories'].items():
-            # Format subcategory name to remove the percentage
-            subcat_name = re.sub(r"\s*\(\d+%\)", "", subcat)
-            # Indent subcategories for better readability
-            score_display = subdata['score'].strip() if subdata['score'] else ""
-            table += f"  - {subcat_name:{section_width-4}} | {score_display:{score_width}}\n".rstrip() + "\n" # rstrip and pad score
+            score_display = subdata['score'] or ""
+            parts.append((ASCII_SUBCAT_PREFIXES[subcat] + score_display).rstrip() + "\n") # rstrip drops the padding after an empty score
 
     # Removed the summary section
 
-    return header + table
-
+    return "".join(parts)
+
+
+# Modification time of this script, read once per process, so tables written
+# by an older version of the extraction logic are regenerated
+SCRIPT_MTIME = os.stat(__file__).st_mtime
+
+# Directory under the base directory holding one stamp per student. It is
+# hidden, so neither --all nor compress_assessment_reports.sh treats it as a
+# student folder, and nothing is added to the folders returned to students.
+RESULTS_STAMP_DIR = ".results_stamps"
+
+def results_stamp_file(base_dir, student_id):
+    """Return the file recording how a student's results.txt was last written by this script"""
+    return Path(base_dir) / RESULTS_STAMP_DIR / f"{student_id}.stamp"
+
+def results_stamp(output_file, ascii_format):
+    """
+    Describe output_file as it stands now: the table format this script wrote
+    it in, plus its size and modification time in nanoseconds, so any later
+    append or hand edit makes the description stop matching
+    """
+    stat = output_file.stat()
+    return f"{'ascii' if ascii_format else 'markdown'} {stat.st_size} {stat.st_mtime_ns}\n"
+
+def write_results_stamp(output_file, stamp_file, ascii_format):
+    """
+    Record that output_file currently holds a table written by this script.
+    The stamp only lets later runs skip work, so failing to write it is ignored.
+    """
+    try:
+        stamp_file.parent.mkdir(exist_ok=True)
+        stamp_file.write_text(results_stamp(output_file, ascii_format), encoding='utf-8')
+    except OSError:
+        pass
+
+def results_up_to_date(output_file, stamp_file, report_mtime, ascii_format):
+    """
+    Return True if output_file is newer than both the report (modified at
+    report_mtime) and this script, and is still exactly the table this script
+    last wrote in the requested format. results.txt is also appended to by
+    run_feedback.sh and add_total_score.sh and may be edited by hand, so its
+    contents are never trusted without a matching stamp.
+    """
+    try:
+        output_mtime = output_file.stat().st_mtime
+        if output_mtime < report_mtime or output_mtime < SCRIPT_MTIME:
+            return False
+        stamp = stamp_file.read_text(encoding='utf-8')
+        return stamp == results_stamp(output_file, ascii_format)
+    except (OSError, UnicodeDecodeError):
+        return False
 
-def process_student(student_id, base_dir, simplified=False, ascii_format=False):
+def process_student(student_id, base_dir, simplified=False, ascii_format=False, force=False):
     file_path = Path(f"{base_dir}/{student_id}/final_assessment/{student_id}_final_assessment_report.md")
 
-    if not file_path.exists():
+    # A single stat both checks that the report exists and gives its mtime
+    try:
+        report_mtime = file_path.stat().st_mtime
+    except FileNotFoundError:
         print(f"Error: File not found: {file_path}")
         return False
 
+    # Always use 'results.txt' as output file name
+    output_file = Path(f"{base_dir}/{student_id}/results.txt")
+    stamp_file = results_stamp_file(base_dir, student_id)
+
+    # Skip parsing entirely when the existing table is newer than the report and
+    # is still exactly what this script last wrote
+    if not force and results_up_to_date(output_file, stamp_file, report_mtime, ascii_format):
+        print(f"Results table for student {student_id} is up to date at {output_file}")
+        return True
+
     results = extract_results_from_report(file_path)
 
     if ascii_format:
@@ -435,33 +602,47 @@ def process_student(student_id, base_dir, simplified=False, ascii_format=False):
     else:
         table_content = create_markdown_table(results, student_id)
 
-    # Always use 'results.txt' as output file name
-    output_file = Path(f"{base_dir}/{student_id}/results.txt")
+    # Leave an identical existing table alone, only refreshing its mtime so the
+    # check above skips it next time
+    try:
+        unchanged = output_file.read_text(encoding='utf-8') == table_content
+    except (OSError, UnicodeDecodeError):
+        unchanged = False
 
-    with open(output_file, 'w', encoding='utf-8') as file:
-        file.write(table_content)
+    if unchanged:
+        os.utime(output_file)
+        write_results_stamp(output_file, stamp_file, ascii_format)
+        print(f"Results table for student {student_id} is unchanged at {output_file}")
+        return True
+
+    output_file.write_text(table_content, encoding='utf-8')
+    write_results_stamp(output_file, stamp_file, ascii_format)
 
     print(f"Results table created for student {student_id} at {output_file}")
     return True
 
-def process_all_students(base_dir, simplified=False, ascii_format=False):
-    success_count = 0
-    failure_count = 0
-
+def process_all_students(base_dir, simplified=False, ascii_format=False, force=False):
     if not Path(base_dir).exists():
         print(f"Error: Base directory not found: {base_dir}")
         return
 
-    # Get all student directories (assuming directories with numeric names are student IDs)
-    student_dirs = [d for d in Path(base_dir).iterdir() if d.is_dir() and d.name.isdigit()]
+    # Get all student directories (assuming directories with numeric names are student IDs).
+    # The name is checked first and is_dir() uses the cached directory entry type,
+    # so non-student entries are never stat()ed
+    with os.scandir(base_dir) as entries:
+        student_ids = [entry.name for entry in entries if entry.name.isdigit() and entry.is_dir()]
+
+    # Each student's report is read, parsed and written independently, so spread
+    # them over one worker process per core
+    # Pass simplified=False as the simplified/detailed output logic is removed
+    worker = partial(process_student, base_dir=base_dir, simplified=False, ascii_format=ascii_format, force=force)
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(student_ids) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        outcomes = list(executor.map(worker, student_ids, chunksize=chunksize))
 
-    for student_dir in student_dirs:
-        student_id = student_dir.name
-        # Pass simplified=False as the simplified/detailed output logic is removed
-        if process_student(student_id, base_dir, simplified=False, ascii_format=ascii_format):
-            success_count += 1
-        else:
-            failure_count += 1
+    success_count = sum(outcomes)
+    failure_count = len(outcomes) - success_count
 
     print(f"\nProcessing complete: {success_count} successful, {failure_count} failed")
 
@@ -474,6 +655,8 @@ def main():
                         help='(Deprecated functionality - now controls output filename suffix) Generate a simplified table.')
     parser.add_argument('--ascii', action='store_true',
                         help='Generate an ASCII-formatted table with fixed-width columns for better alignment')
+    parser.add_argument('--force', action='store_true',
+                        help='Regenerate results.txt even if it is newer than the student\'s report')
 
     # Create a mutually exclusive group for student_id or --all
     group = parser.add_mutually_exclusive_group(required=True)
@@ -485,9 +668,9 @@ def main():
     # The simplified flag now only affects the output filename suffix
     # The table content format is now consistently the "minimal" version
     if args.all:
-        process_all_students(args.base_dir, simplified=False, ascii_format=args.ascii)
+        process_all_students(args.base_dir, simplified=False, ascii_format=args.ascii, force=args.force)
     else:
-        process_student(args.student_id, args.base_dir, simplified=False, ascii_format=args.ascii)
+        process_student(args.student_id, args.base_dir, simplified=False, ascii_format=args.ascii, force=args.force)
 
 if __name__ == "__main__" :
     main()
@@ -1,56 +1,148 @@
 import os
 import re
+import mmap
 import argparse
-import chardet
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
 import validators
 
-def is_text_file(file_path, blocksize=512):
+# Fastest available encoding detector for --accurate: cchardet, then its
+# successor charset-normalizer, then chardet itself
+try:
+    from cchardet import detect
+except ImportError:
+    try:
+        from charset_normalizer import detect
+    except ImportError:
+        from chardet import detect
+
+# URL patterns, run over the undecoded bytes of each file as they are pure ASCII
+URL_PATTERNS = [
+    re.compile(rb'\[.*?\]\((https?://[^\)]+)\)'),  # markdown inline links
+    re.compile(rb'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+(/[^\s]*)?'),  # raw URLs
+]
+
+# Cheap shape check applied to every candidate URL; --strict uses validators.url instead
+URL_SHAPE_REGEX = re.compile(r'^https?://[^\s<>"\']{3,2048}$')
+
+# Folders with fewer files than this are scanned serially, as starting the
+# worker processes would cost more than it saves
+PARALLEL_MIN_FILES = 50
+
+# Files smaller than this are read outright; mapping them costs more than it saves
+MMAP_MIN_SIZE = 4096
+
+# Bytes plain text is made of: printable ASCII plus the common whitespace controls
+TEXT_CHARS = bytes(range(32, 127)) + b'\n\r\t\f\b'
+
+def is_text_file(file_path, blocksize=512, accurate=False):
     with open(file_path, 'rb') as f:
         chunk = f.read(blocksize)
     if not chunk:
         return False
-    encoding = chardet.detect(chunk)['encoding']
-    return encoding is not None
-
-def extract_urls(file_path):
-    patterns = [
-        r'\[.*?\]\((https?://[^\)]+)\)',  # markdown inline links
-        r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+(/[^\s]*)?'  # raw URLs
-    ]
-    
+    if accurate:
+        encoding = detect(chunk)['encoding']
+        return encoding is not None
+
+    # Quick checks in the style of file(1) and git: NUL bytes mean binary, valid
+    # UTF-8 (allowing a character cut off at the block end) means text, and
+    # anything else is text if under 30% of it is outside TEXT_CHARS
+    if b'\x00' in chunk:
+        return False
+    try:
+        chunk.decode('utf-8')
+        return True
+    except UnicodeDecodeError as e:
+        if e.reason == 'unexpected end of data' and e.end == len(chunk):
+            return True
+    return len(chunk.translate(None, TEXT_CHARS)) < 0.30 * len(chunk)
+
+def read_content(file_path):
+    """
+    Return the raw bytes of a file, memory-mapped read-only once it reaches
+    MMAP_MIN_SIZE. The map is released once the last reference to it is dropped.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+            return f.read()
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def extract_urls(file_path, strict=False):
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        urls = []
-        for pattern in patterns:
-            urls.extend(re.findall(pattern, content))
-        return [u for u in set(urls) if validators.url(u)]
+        content = read_content(file_path)
+        is_valid = validators.url if strict else URL_SHAPE_REGEX.match
+
+        # De-duplicate and validate in a single pass, checking each distinct URL
+        # once. Only the matches are decoded
+        seen = {}
+        for pattern in URL_PATTERNS:
+            for match in pattern.findall(content):
+                url = match.decode('utf-8', errors='ignore')
+                if url not in seen:
+                    seen[url] = bool(is_valid(url))
+        return [url for url, valid in seen.items() if valid]
     except Exception as e:
         print(f"[!] Could not process {file_path}: {e}")
         return []
 
-def process_path(path, output_file):
+def extract_text_file_urls(file_path, strict=False, accurate=False):
+    """Return the URLs found in file_path, or None if it is not a text file"""
+    if not is_text_file(file_path, accurate=accurate):
+        return None
+    return extract_urls(file_path, strict)
+
+def _iter_files(root):
+    """
+    Yield the path of every file under root, as os.walk would list them,
+    reusing scandir's cached entry type instead of stat-ing each path.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if not is_dir:
+            yield entry.path
+        elif not entry.is_symlink():
+            yield from _iter_files(entry.path)
+
+def process_path(path, output_file, strict=False, accurate=False):
     all_urls = set()
 
     if os.path.isfile(path):
-        urls = extract_urls(path)
+        urls = extract_urls(path, strict)
         all_urls.update(urls)
     elif os.path.isdir(path):
-        for root, _, files in os.walk(path):
-            for name in files:
-                file_path = os.path.join(root, name)
-                if is_text_file(file_path):
-                    urls = extract_urls(file_path)
-                    all_urls.update(urls)
-                else:
-                    print(f"[i] Skipping binary file: {file_path}")
+        file_paths = list(_iter_files(path))
+
+        # Each file is checked and scanned independently, so larger folders are
+        # spread over one worker process per core
+        worker = partial(extract_text_file_urls, strict=strict, accurate=accurate)
+        if len(file_paths) < PARALLEL_MIN_FILES:
+            outcomes = list(map(worker, file_paths))
+        else:
+            workers = os.cpu_count() or 1
+            chunksize = max(1, len(file_paths) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(worker, file_paths, chunksize=chunksize))
+
+        for file_path, urls in zip(file_paths, outcomes):
+            if urls is None:
+                print(f"[i] Skipping binary file: {file_path}")
+            else:
+                all_urls.update(urls)
     else:
         print(f"[!] Invalid path: {path}")
         return
 
+    # Build the whole listing and write it in one call
     with open(output_file, 'w', encoding='utf-8') as f:
-        for url in sorted(all_urls):
-            f.write(url + '\n')
+        f.write(''.join(url + '\n' for url in sorted(all_urls)))
 
     print(f"[✓] Saved {len(all_urls)} URLs to {output_file}")
 
@@ -58,9 +150,11 @@ def main():
     parser = argparse.ArgumentParser(description="Extract URLs from a text file or folder")
     parser.add_argument("path", help="Path to a file or folder")
     parser.add_argument("--output", default="urls.txt", help="Output file name")
+    parser.add_argument("--strict", action="store_true", help="Validate each URL with validators.url (slower)")
+    parser.add_argument("--accurate", action="store_true", help="Detect text files with an encoding detector (slower)")
     args = parser.parse_args()
 
-    process_path(args.path, args.output)
+    process_path(args.path, args.output, args.strict, args.accurate)
 
 if __name__ == "__main__":
     main()
@@ -4,30 +4,103 @@ import os
 import shutil
 from pathlib import Path
 import logging
-
-from docx import Document
-from pdfminer.high_level import extract_text as extract_pdf_text
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 logging.getLogger("pdfminer").setLevel(logging.ERROR)
 
+# MuPDF is not thread-safe, so PDFs are extracted one at a time
+_pymupdf_lock = threading.Lock()
+
+# The PDF text extractor, chosen and imported on first use by _pdf_text_extractor()
+_pdf_extract_text = None
+
+def _pdf_text_extractor():
+    """
+    Return the PDF text extractor, importing it the first time it is needed.
+    Prefers PyMuPDF's C text extraction, falling back to the pure-Python pdfminer.
+    """
+    global _pdf_extract_text
+    if _pdf_extract_text is None:
+        try:
+            import pymupdf
+        except ImportError:
+            from pdfminer.high_level import extract_text
+        else:
+            def extract_text(path: str) -> str:
+                with _pymupdf_lock, pymupdf.open(path) as doc:
+                    return "\n".join(page.get_text("text") for page in doc)
+        _pdf_extract_text = extract_text
+    return _pdf_extract_text
+
+def extract_pdf_text(path: str) -> str:
+    return _pdf_text_extractor()(path)
+
 def extract_docx(path: Path) -> str:
+    # python-docx is only imported once a DOCX file turns up
+    from docx import Document
     doc = Document(path)
     return "\n".join(p.text for p in doc.paragraphs)
 
+def output_name(file_path: Path):
+    """Return the name file_path is saved under in the output dir, or None if it is ignored"""
+    ext = file_path.suffix.lower()
+    if ext in {".pdf", ".docx"}:
+        return file_path.stem + ".txt"
+    if ext in {".txt", ".md"}:
+        return file_path.name
+    return None
+
+def is_up_to_date(file_path: Path, out_file: Path) -> bool:
+    """Return True if out_file is a non-empty extraction at least as new as file_path"""
+    try:
+        out_stat = out_file.stat()
+    except FileNotFoundError:
+        return False
+    return out_stat.st_size > 0 and out_stat.st_mtime >= file_path.stat().st_mtime
+
 def process_file(file_path: Path, output_dir: Path):
     ext = file_path.suffix.lower()
+    # Skip re-extracting PDFs and DOCX files whose text is already up to date
+    if ext in {".pdf", ".docx"} and is_up_to_date(file_path, output_dir / output_name(file_path)):
+        return
     if ext == ".pdf":
         text = extract_pdf_text(str(file_path))
-        out_file = output_dir / (file_path.stem + ".txt")
+        out_file = output_dir / output_name(file_path)
         out_file.write_text(text, encoding="utf-8")
     elif ext == ".docx":
         text = extract_docx(file_path)
-        out_file = output_dir / (file_path.stem + ".txt")
+        out_file = output_dir / output_name(file_path)
         out_file.write_text(text, encoding="utf-8")
     elif ext in {".txt", ".md"}:
-        shutil.copy2(file_path, output_dir / file_path.name)
+        shutil.copy2(file_path, output_dir / output_name(file_path))
     # else: ignore
 
+def _iter_files(root: Path, skip_dir: Path):
+    """
+    Yield every file under root as a Path, in the same order as os.walk (each
+    folder's files before its subfolders), without descending into skip_dir.
+    Reuses scandir's cached entry type instead of stat-ing each path.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if not is_dir:
+            yield Path(entry.path)
+        elif not entry.is_symlink():
+            subdirs.append(Path(entry.path))
+    for dir_path in subdirs:
+        if dir_path != skip_dir:
+            yield from _iter_files(dir_path, skip_dir)
+
 def main():
     parser = argparse.ArgumentParser(
         description="Recursively extract text from PDF/DOCX and copy TXT/MD into an output directory."
@@ -40,17 +113,20 @@ def main():
     output_dir = Path(args.output_dir).resolve()
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Walk the tree
-    for root, dirs, files in os.walk(input_dir):
-        root_path = Path(root).resolve()
-
-        # Skip walking into the output_dir itself
-        if output_dir == root_path or output_dir in root_path.parents:
-            continue
+    # Walk the tree, skipping the output_dir itself. When several files map to
+    # the same output name only the last one walked is kept, as it would have
+    # overwritten the others
+    files_by_output = {}
+    if output_dir != input_dir and output_dir not in input_dir.parents:
+        for file_path in _iter_files(input_dir, output_dir):
+            name = output_name(file_path)
+            if name is not None:
+                files_by_output[name] = file_path
 
-        for fname in files:
-            file_path = root_path / fname
-            process_file(file_path, output_dir)
+    # PDF and DOCX extraction dominate and each file is independent, so run
+    # them on a thread pool
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(lambda file_path: process_file(file_path, output_dir), files_by_output.values()))
     print(f"Processed files from {os.path.basename(input_dir)}") 
 if __name__ == "__main__":
     main()
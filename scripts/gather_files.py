@@ -8,21 +8,51 @@ prefaced by a "--- Filename: relative/path ---" header.
 """
 
 import argparse
+import os
+import shutil
 from pathlib import Path
 
+# Chunk size used when copying each file into the output
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# File extensions gathered into the output
+GATHERED_SUFFIXES = frozenset(('.txt', '.md', '.css', '.html', '.js'))
+
+def _iter_files(root: Path):
+    """
+    Yield every gathered file under root as a Path, in sorted path order, not
+    following directory symlinks (as rglob does). Each folder's entries are
+    sorted by name as they are walked, so only the kept files are ever built
+    into Paths, and scandir's cached entry type saves stat-ing each path.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_files(Path(entry.path))
+        elif os.path.splitext(entry.name)[1].lower() in GATHERED_SUFFIXES and entry.is_file():
+            yield Path(entry.path)
+
 def gather_files(input_dir: Path, output_file: Path):
     """
     Walk input_dir for .txt .md .css .html .js files, and write them to output_file.
     """
-    with output_file.open('w', encoding='utf-8') as out:
-        # Sort for consistent ordering
-        for path in sorted(input_dir.rglob('*')):
-            if path.is_file() and path.suffix.lower() in ('.txt', '.md', '.css', '.html', '.js'):
+    with output_file.open('wb') as out:
+        # Files come out in sorted order for consistent output
+        for path in _iter_files(input_dir):
+            with path.open('rb') as src:
+                # The output file may itself sit under input_dir; copying it
+                # into itself would never reach the end
+                if os.path.sameopenfile(src.fileno(), out.fileno()):
+                    continue
                 rel_path = path.relative_to(input_dir)
-                out.write(f"--- Filename: {rel_path} ---\n")
-                # Write file contents
-                out.write(path.read_text(encoding='utf-8'))
-                out.write('\n\n')  # blank line between entries
+                out.write(f"--- Filename: {rel_path} ---\n".encode('utf-8'))
+                # Copy file contents byte for byte, without decoding them
+                shutil.copyfileobj(src, out, COPY_BUFFER_SIZE)
+            out.write(b'\n\n')  # blank line between entries
 
 def main():
     parser = argparse.ArgumentParser(
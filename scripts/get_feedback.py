@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 import os
 import sys
+import json
+import time
 import argparse
-from openai import OpenAI
 
 DEFAULT_SYSTEM_PROMPT = (
     "You are an experienced web-development assessor. "
@@ -13,6 +14,86 @@ DEFAULT_SYSTEM_PROMPT = (
     "of any AI suggestions."
 )
 
+# Batch job states after which it will make no further progress
+BATCH_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+def build_messages(system_prompt, user_prompt, content):
+    return [
+        {"role": "system", "content": system_prompt},
+        {
+            "role": "user",
+            "content": f"{user_prompt}\n\n--- Attached content below ---\n{content}"
+        }
+    ]
+
+def run_batch(client, args, system_prompt, user_prompt):
+    """
+    Send every content file as one request of a single OpenAI Batch job, wait
+    for it to finish and append each reply to args.batch_output in the folder
+    of its content file.
+    """
+    # Write one chat completion request per content file, keyed by its index
+    try:
+        with open(args.batch, "w", encoding="utf-8") as manifest:
+            for index, content_file in enumerate(args.content_file):
+                with open(content_file, "r", encoding="utf-8") as f:
+                    content = f.read().strip()
+                request = {
+                    "custom_id": str(index),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": args.model,
+                        "messages": build_messages(system_prompt, user_prompt, content),
+                        "temperature": args.temperature
+                    }
+                }
+                manifest.write(json.dumps(request) + "\n")
+    except IOError as e:
+        print(f"ERROR reading input files: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    # Upload the requests, start the job and poll until it is done
+    try:
+        with open(args.batch, "rb") as manifest:
+            batch_file = client.files.create(file=manifest, purpose="batch")
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"Submitted batch {batch.id} with {len(args.content_file)} requests", file=sys.stderr)
+        while batch.status not in BATCH_FINAL_STATUSES:
+            time.sleep(args.poll_interval)
+            batch = client.batches.retrieve(batch.id)
+        output = client.files.content(batch.output_file_id).text if batch.output_file_id else ""
+    except Exception as e:
+        print(f"API error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    # Append each successful reply beside its content file
+    answered = set()
+    for line in output.splitlines():
+        result = json.loads(line)
+        content_file = args.content_file[int(result["custom_id"])]
+        response = result.get("response") or {}
+        if response.get("status_code") != 200:
+            print(f"API error for {content_file}: {result.get('error') or response.get('body')}", file=sys.stderr)
+            continue
+        reply = response["body"]["choices"][0]["message"]["content"].strip()
+        output_file = os.path.join(os.path.dirname(content_file), args.batch_output)
+        with open(output_file, "a", encoding="utf-8") as f:
+            f.write(reply + "\n")
+        answered.add(content_file)
+        print(f"→ Appended feedback to {output_file}", file=sys.stderr)
+
+    missing = [content_file for content_file in args.content_file if content_file not in answered]
+    if missing:
+        print(f"Batch {batch.id} ({batch.status}) returned no feedback for:", file=sys.stderr)
+        for content_file in missing:
+            print(f"  {content_file}", file=sys.stderr)
+        sys.exit(1)
+
 def main():
     parser = argparse.ArgumentParser(
         description="Send prompt+content to OpenAI as a web-dev assessor."
@@ -23,7 +104,9 @@ def main():
     )
     parser.add_argument(
         "content_file",
-        help="Path to the text file containing the attached project files (e.g. contents.txt)"
+        nargs="+",
+        help="Path to the text file containing the attached project files (e.g. contents.txt); "
+             "several may be given with --batch"
     )
     parser.add_argument(
         "--system-file",
@@ -41,8 +124,28 @@ def main():
         default=1,
         help="Sampling temperature (default: %(default)s)"
     )
+    parser.add_argument(
+        "--batch",
+        metavar="MANIFEST",
+        help="Send every content file as one OpenAI Batch job, writing its request lines "
+             "to MANIFEST; each reply is appended to --batch-output beside its content file"
+    )
+    parser.add_argument(
+        "--batch-output",
+        default="results.txt",
+        help="File name replies are appended to in --batch mode (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=60,
+        help="Seconds between batch status checks (default: %(default)s)"
+    )
     args = parser.parse_args()
 
+    if not args.batch and len(args.content_file) > 1:
+        parser.error("several content files can only be sent with --batch")
+
     # Load API key
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
@@ -60,39 +163,81 @@ def main():
     else:
         system_prompt = DEFAULT_SYSTEM_PROMPT
 
-    # Read user prompt and content
+    # Read user prompt
     try:
         with open(args.prompt_file, "r", encoding="utf-8") as f:
             user_prompt = f.read().strip()
-        with open(args.content_file, "r", encoding="utf-8") as f:
+    except IOError as e:
+        print(f"ERROR reading input files: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    # Imported here so --help and argument errors don't pay for loading the client
+    from openai import OpenAI
+    client = OpenAI(api_key=api_key)
+    if args.batch:
+        run_batch(client, args, system_prompt, user_prompt)
+        return
+
+    # Read content
+    try:
+        with open(args.content_file[0], "r", encoding="utf-8") as f:
             content = f.read().strip()
     except IOError as e:
         print(f"ERROR reading input files: {e}", file=sys.stderr)
         sys.exit(1)
 
     # Build messages payload
-    messages = [
-        {"role": "system", "content": system_prompt},
-        {
-            "role": "user",
-            "content": f"{user_prompt}\n\n--- Attached content below ---\n{content}"
-        }
-    ]
+    messages = build_messages(system_prompt, user_prompt, content)
+    # The message holds its own copy of the content; drop ours so only one
+    # copy of a large blob stays alive while the request is sent
+    del content
 
-    # Call the new v1 client
-    client = OpenAI(api_key=api_key)
+    # Call the new v1 client, streaming the reply as it is generated. When
+    # stdout is redirected (run_feedback.sh appends it to results.txt) the
+    # reply is held until the stream completes, so a failed request never
+    # leaves a partial reply in the file.
+    live = sys.stdout.isatty()
+    parts = []
+    write = sys.stdout.write if live else parts.append
+    started = False
     try:
-        resp = client.chat.completions.create(
+        stream = client.chat.completions.create(
             model=args.model,
             messages=messages,
-            temperature=args.temperature
+            temperature=args.temperature,
+            stream=True
         )
+
+        # Print the assistant’s reply as it arrives, stripped as before: leading
+        # whitespace is dropped and trailing whitespace is held back until more
+        # text follows it
+        pending = ""
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            if not started:
+                delta = delta.lstrip()
+                if not delta:
+                    continue
+                started = True
+            text = pending + delta
+            stripped = text.rstrip()
+            pending = text[len(stripped):]
+            if stripped:
+                write(stripped)
+                if live:
+                    sys.stdout.flush()
     except Exception as e:
+        if live and started:
+            print("\n[Reply truncated: the stream ended with an error]")
         print(f"API error: {e}", file=sys.stderr)
         sys.exit(1)
-
-    # Print the assistant’s reply
-    print(resp.choices[0].message.content.strip())
+    if parts:
+        sys.stdout.write("".join(parts))
+    print()
 
 
 if __name__ == "__main__":
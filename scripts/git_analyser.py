@@ -2,7 +2,6 @@ import os
 import sys
 import argparse
 import re
-import json
 import csv
 import subprocess
 from pathlib import Path
@@ -10,7 +9,31 @@ from datetime import datetime, timedelta
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from collections import defaultdict, Counter
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Commit fields read from `git log`, with the format placeholder for each
+COMMIT_LOG_FIELDS = {
+    'hash': '%H',
+    'abbreviated_hash': '%h',
+    'parent_hashes': '%P',
+    'author_name': '%an',
+    'author_email': '%ae',
+    'author_date': '%ai',
+    'committer_name': '%cn',
+    'committer_email': '%ce',
+    'committer_date': '%ci',
+    'subject': '%s',
+    'body': '%b',
+    'notes': '%N'
+}
+
+# Commit message patterns used when scoring every commit
+WORD_REGEX = re.compile(r'\b[a-zA-Z]+\b')
+LEADING_VERB_REGEX = re.compile(r'^[A-Z]?[a-z]+s?\b')
+EXPLANATION_REGEX = re.compile(r'\b(because|since|as|to allow|to fix|to enable|in order to)\b', re.IGNORECASE)
+ISSUE_REFERENCE_REGEX = re.compile(r'(^|\s)#\d+\b|GH-\d+')
 
 
 class GitRepoAnalyzer:
@@ -28,6 +51,13 @@ class GitRepoAnalyzer:
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
         
+        # Environment for every git subprocess: never prompt for credentials
+        self._git_env = {
+            **os.environ,
+            'GIT_SSH_COMMAND': 'ssh -o BatchMode=yes',
+            'GIT_TERMINAL_PROMPT': '0'
+        }
+        
         # Check if the path is a valid Git repository
         self.is_git_repo = self._is_git_repo()
         
@@ -62,10 +92,6 @@ class GitRepoAnalyzer:
     def _is_git_repo(self):
         """Check if the path is a valid Git repository."""
         try:
-            env = os.environ.copy()
-            env['GIT_SSH_COMMAND'] = 'ssh -o BatchMode=yes'
-            env['GIT_TERMINAL_PROMPT'] = '0'
-            
             result = subprocess.run(
                 ['git', 'rev-parse', '--is-inside-work-tree'],
                 cwd=self.repo_path,
@@ -73,7 +99,7 @@ class GitRepoAnalyzer:
                 stderr=subprocess.PIPE,
                 universal_newlines=True,
                 check=True,
-                env=env
+                env=self._git_env
             )
             return result.stdout.strip() == 'true'
         except (subprocess.SubprocessError, FileNotFoundError):
@@ -134,16 +160,18 @@ class GitRepoAnalyzer:
         return performance, round(points, 2)
     
 
-    def run_git_command(self, command):
-        """Run a Git command in the repository directory."""
+    def run_git_command(self, command, strip=True):
+        """
+        Run a Git command in the repository directory.
+        
+        Args:
+            command: Git command and arguments
+            strip: Whether to strip surrounding whitespace from the output
+        """
         if not self.is_git_repo:
             raise ValueError("Not a valid Git repository")
         
         try:
-            env = os.environ.copy()
-            env['GIT_SSH_COMMAND'] = 'ssh -o BatchMode=yes'
-            env['GIT_TERMINAL_PROMPT'] = '0'
-            
             result = subprocess.run(
                 command,
                 cwd=self.repo_path,
@@ -151,9 +179,9 @@ class GitRepoAnalyzer:
                 stderr=subprocess.PIPE,
                 universal_newlines=True,
                 check=True,
-                env=env
+                env=self._git_env
             )
-            return result.stdout.strip()
+            return result.stdout.strip() if strip else result.stdout
         except subprocess.CalledProcessError as e:
             print(f"Git command failed: {e}")
             print(f"Error output: {e.stderr}")
@@ -166,60 +194,53 @@ class GitRepoAnalyzer:
         Returns:
             List of commit data dictionaries
         """
-        # Get raw commit log with detailed information
+        # Get the commit log and every commit's per-file numstat in one call. Each
+        # commit starts with a record separator and its fields end with a unit
+        # separator, so quotes and newlines in messages can't break the parsing;
+        # --cc gives merges the same stats as `git show --stat`
         git_log_command = [
-            'git', 'log', 
-            '--pretty=format:{%n  "hash": "%H",%n  "abbreviated_hash": "%h",%n  "parent_hashes": "%P",%n  "author_name": "%an",%n  "author_email": "%ae",%n  "author_date": "%ai",%n  "committer_name": "%cn",%n  "committer_email": "%ce",%n  "committer_date": "%ci",%n  "subject": "%s",%n  "body": "%b",%n  "notes": "%N"%n},',
+            'git', 'log', '--numstat', '--cc', '-z',
+            '--pretty=format:%x1e' + ''.join(f'{placeholder}%x1f' for placeholder in COMMIT_LOG_FIELDS.values()),
         ]
-        log_output = self.run_git_command(git_log_command)
+        log_output = self.run_git_command(git_log_command, strip=False)
         
         if not log_output:
             return []
         
-        # Parse the JSON output
-        json_output = f"[{log_output.rstrip(',')}]"
-        try:
-            commits = json.loads(json_output)
-        except json.JSONDecodeError as e:
-            print(f"Error parsing Git log output: {e}")
-            return []
-        
-        # Get stats for each commit (files changed, insertions, deletions)
-        for commit in commits:
-            stats_command = ['git', 'show', '--stat', '--format=format:', commit['hash']]
-            stats_output = self.run_git_command(stats_command)
-            
-            if stats_output:
-                # Parse stats output
-                files_changed = 0
-                insertions = 0
-                deletions = 0
-                
-                stats_summary = stats_output.strip().split('\n')[-1]
-                if stats_summary:
-                    # Extract numbers for files changed, insertions, and deletions
-                    files_match = re.search(r'(\d+) file', stats_summary)
-                    insertions_match = re.search(r'(\d+) insertion', stats_summary)
-                    deletions_match = re.search(r'(\d+) deletion', stats_summary)
-                    
-                    if files_match:
-                        files_changed = int(files_match.group(1))
-                    if insertions_match:
-                        insertions = int(insertions_match.group(1))
-                    if deletions_match:
-                        deletions = int(deletions_match.group(1))
-                
-                commit['stats'] = {
-                    'files_changed': files_changed,
-                    'insertions': insertions,
-                    'deletions': deletions
-                }
-            else:
-                commit['stats'] = {
-                    'files_changed': 0,
-                    'insertions': 0,
-                    'deletions': 0
-                }
+        commits = []
+        for record in log_output.split('\x1e'):
+            if not record:
+                continue
+            *values, numstat = record.split('\x1f', len(COMMIT_LOG_FIELDS))
+            commit = dict(zip(COMMIT_LOG_FIELDS, values))
+            
+            # Sum the numstat lines ("insertions<TAB>deletions<TAB>path", with "-"
+            # counts for binary files). A rename has an empty path followed by the
+            # old and new paths as separate entries
+            files_changed = 0
+            insertions = 0
+            deletions = 0
+            entries = iter(numstat.split('\0'))
+            for entry in entries:
+                parts = entry.lstrip('\n').split('\t', 2)
+                if len(parts) != 3:
+                    continue
+                added, deleted, path = parts
+                files_changed += 1
+                if added != '-':
+                    insertions += int(added)
+                if deleted != '-':
+                    deletions += int(deleted)
+                if not path:
+                    next(entries, None)
+                    next(entries, None)
+            
+            commit['stats'] = {
+                'files_changed': files_changed,
+                'insertions': insertions,
+                'deletions': deletions
+            }
+            commits.append(commit)
         
         return commits
     
@@ -240,7 +261,37 @@ class GitRepoAnalyzer:
         return branches
     
     def get_repository_structure(self):
-        """Get the structure of the repository."""
+        """
+        Get the structure of the repository from the files Git tracks, read
+        from the index in one call rather than by walking the working tree.
+        Falls back to walking the working tree if the file list can't be read.
+        """
+        tracked_output = self.run_git_command(['git', 'ls-files', '-z'], strip=False) if self.is_git_repo else None
+        if tracked_output is None:
+            return self._get_working_tree_structure()
+        
+        tracked_files = {path for path in tracked_output.split('\0') if path}
+        
+        # Every directory holding a tracked file, at any depth
+        directories = set()
+        for path in tracked_files:
+            while '/' in path:
+                path = path.rsplit('/', 1)[0]
+                if path in directories:
+                    break
+                directories.add(path)
+        
+        return {
+            'file_count': len(tracked_files),
+            'directory_count': len(directories),
+            'top_level_directories': sorted(path for path in directories if '/' not in path),
+            'readme_exists': any(f in tracked_files for f in ['README.md', 'README.txt', 'README']),
+            'license_exists': any(f in tracked_files for f in ['LICENSE', 'LICENSE.md', 'LICENSE.txt']),
+            'gitignore_exists': '.gitignore' in tracked_files
+        }
+    
+    def _get_working_tree_structure(self):
+        """Get the structure of the repository by walking its working tree."""
         try:
             file_count = 0
             dir_count = 0
@@ -334,7 +385,7 @@ class GitRepoAnalyzer:
             message_lengths.append(message_length)
             
             # Extract words for word frequency analysis
-            words = re.findall(r'\b[a-zA-Z]+\b', message.lower())
+            words = WORD_REGEX.findall(message.lower())
             all_words.extend(words)
             
             # Score the message quality
@@ -390,30 +441,34 @@ class GitRepoAnalyzer:
         if not subject:
             return 0
         
+        criteria = self.commit_message_criteria
+        min_length = criteria['min_length']
+        
         # Evaluate subject length
         subject_length = len(subject)
-        if subject_length < self.commit_message_criteria['min_length']:
+        if subject_length < min_length:
             score -= 2  # Too short
-        elif subject_length > self.commit_message_criteria['max_length']:
+        elif subject_length > criteria['max_length']:
             score -= 1  # Too long
-        elif self.commit_message_criteria['min_length'] <= subject_length <= 50:
+        elif min_length <= subject_length <= 50:
             score += 1  # Good length
         
         # Check for descriptive words in subject
-        has_descriptive_word = any(word in subject.lower() for word in self.commit_message_criteria['descriptive_words'])
+        subject_lower = subject.lower()
+        has_descriptive_word = any(word in subject_lower for word in criteria['descriptive_words'])
         if has_descriptive_word:
             score += 1
         
         # Check if subject starts with a verb (common good practice)
-        if re.match(r'^[A-Z]?[a-z]+s?\b', subject):
+        if LEADING_VERB_REGEX.match(subject):
             score += 1
         
         # Check for detailed body
-        if body and len(body) > self.commit_message_criteria['detail_threshold']:
+        if body and len(body) > criteria['detail_threshold']:
             score += 2
         
         # Check for explanation of why the change was made (often indicated by "because", "since", etc.)
-        if body and re.search(r'\b(because|since|as|to allow|to fix|to enable|in order to)\b', body, re.IGNORECASE):
+        if body and EXPLANATION_REGEX.search(body):
             score += 1
         
         # Penalize for all caps (SHOUTING)
@@ -421,7 +476,7 @@ class GitRepoAnalyzer:
             score -= 1
         
         # Check for issue references (#123, GH-123, etc.)
-        if re.search(r'(^|\s)#\d+\b|GH-\d+', subject + ' ' + body):
+        if ISSUE_REFERENCE_REGEX.search(subject + ' ' + body):
             score += 1
         
         # Ensure score is within bounds
@@ -452,13 +507,14 @@ class GitRepoAnalyzer:
                 'frequency_score': 0
             }
         
-        # Sort commits by date
-        sorted_commits = sorted(commits, key=lambda x: x.get('author_date', ''))
-        
         # Calculate date range
         try:
-            first_commit_date = datetime.strptime(sorted_commits[-1]['author_date'].split()[0], '%Y-%m-%d')
-            last_commit_date = datetime.strptime(sorted_commits[0]['author_date'].split()[0], '%Y-%m-%d')
+            # Work column-wise on the two fields we need rather than per-commit dict lookups
+            df = pd.DataFrame(commits, columns=['author_date', 'author_name'])
+            df['day'] = pd.to_datetime(df['author_date'].str.slice(0, 10), format='%Y-%m-%d')
+            
+            first_commit_date = df['day'].max().to_pydatetime()
+            last_commit_date = df['day'].min().to_pydatetime()
             
             # Ensure we analyze at least the specified days
             analysis_start_date = max(
@@ -469,41 +525,26 @@ class GitRepoAnalyzer:
             # Calculate total project duration in days
             project_duration = (last_commit_date - first_commit_date).days + 1
             
-            # Initialize data structures
-            commits_per_day = defaultdict(int)
-            commits_per_author = defaultdict(int)
-            
-            # Generate all dates in range
-            current_date = analysis_start_date
-            while current_date <= last_commit_date:
-                commits_per_day[current_date.strftime('%Y-%m-%d')] = 0
-                current_date += timedelta(days=1)
-            
             # Count commits per day and author
-            for commit in commits:
-                commit_date = datetime.strptime(commit['author_date'].split()[0], '%Y-%m-%d')
-                author = commit['author_name']
-                
-                if commit_date >= analysis_start_date:
-                    commits_per_day[commit_date.strftime('%Y-%m-%d')] += 1
-                    commits_per_author[author] += 1
-            
-            # Calculate gaps between commits
-            commit_dates = [date for date, count in commits_per_day.items() if count > 0]
-            commit_dates = sorted(commit_dates)
+            analyzed = df[df['day'] >= analysis_start_date]
+            commits_per_author = analyzed['author_name'].value_counts(sort=False).to_dict()
+            day_counts = analyzed.groupby('day').size()
             
-            gaps = []
-            for i in range(1, len(commit_dates)):
-                date1 = datetime.strptime(commit_dates[i-1], '%Y-%m-%d')
-                date2 = datetime.strptime(commit_dates[i], '%Y-%m-%d')
-                gap = (date2 - date1).days
-                if gap > 1:  # Only count gaps larger than 1 day
-                    gaps.append(gap)
+            # Include every date in range, with zero counts for days without commits
+            full_day_range = pd.date_range(analysis_start_date, last_commit_date, freq='D')
+            day_counts = day_counts.reindex(full_day_range.union(day_counts.index), fill_value=0)
+            daily_counts = day_counts.to_numpy()
+            commits_per_day = dict(zip(day_counts.index.strftime('%Y-%m-%d'), daily_counts.tolist()))
             
-            largest_gap = max(gaps) if gaps else 0
+            # Calculate gaps between commits
+            commit_days = day_counts.index[daily_counts > 0].to_numpy().astype('datetime64[D]')
+            day_diffs = np.diff(commit_days).astype(int)
+            gap_days = day_diffs[day_diffs > 1]  # Only count gaps larger than 1 day
+
+            gaps = gap_days.tolist()
+            largest_gap = int(gap_days.max()) if gap_days.size else 0
             
             # Calculate daily commit statistics
-            daily_counts = list(commits_per_day.values())
             mean_commits = np.mean(daily_counts)
             median_commits = np.median(daily_counts)
             std_dev = np.std(daily_counts)
@@ -512,15 +553,15 @@ class GitRepoAnalyzer:
             # Calculate weekly commits
             days_analyzed = (last_commit_date - analysis_start_date).days + 1
             weeks_analyzed = max(1, days_analyzed / 7)
-            total_commits = sum(daily_counts)
+            total_commits = int(daily_counts.sum())
             commits_per_week = total_commits / weeks_analyzed
             
             # Calculate days with commits vs total days
-            days_with_commits = sum(1 for count in daily_counts if count > 0)
+            days_with_commits = int(np.count_nonzero(daily_counts))
             commit_day_ratio = days_with_commits / max(1, len(daily_counts))
             
             # Detect "commit burst" pattern
-            max_commits_in_day = max(daily_counts) if daily_counts else 0
+            max_commits_in_day = int(daily_counts.max()) if daily_counts.size else 0
             commit_burst_ratio = max_commits_in_day / max(1, total_commits)
             
             # Calculate frequency score
@@ -693,14 +734,15 @@ class GitRepoAnalyzer:
                 'error': 'Not a valid Git repository'
             }
         
-        # Get commit history
-        commits = self.get_commit_history()
-        
-        # Get branches
-        branches = self.get_branches()
-        
-        # Get repository structure
-        repo_structure = self.get_repository_structure()
+        # Get commit history, branches and repository structure. Each is a
+        # separate git call that waits on its own subprocess, so run them together
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            commits_future = executor.submit(self.get_commit_history)
+            branches_future = executor.submit(self.get_branches)
+            repo_structure_future = executor.submit(self.get_repository_structure)
+        commits = commits_future.result()
+        branches = branches_future.result()
+        repo_structure = repo_structure_future.result()
         
         # Analyze commit messages
         message_analysis = self.analyze_commit_messages(commits)
@@ -738,7 +780,7 @@ class GitRepoAnalyzer:
         # Prepare CSV file
         csv_path = os.path.join(self.output_dir, 'commit_details.csv')
         
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        with open(csv_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
             writer = csv.writer(f)
             
             # Write header
@@ -753,18 +795,21 @@ class GitRepoAnalyzer:
                 'Deletions'
             ])
             
-            # Write commit data
-            for commit in commits:
-                writer.writerow([
+            # Write commit data in one call, one row per commit
+            writer.writerows(
+                (
                     commit.get('abbreviated_hash', ''),
                     commit.get('author_name', ''),
                     commit.get('author_date', '').split()[0],  # Just the date part
                     commit.get('subject', ''),
                     len(commit.get('body', '')),
-                    commit.get('stats', {}).get('files_changed', 0),
-                    commit.get('stats', {}).get('insertions', 0),
-                    commit.get('stats', {}).get('deletions', 0)
-                ])
+                    stats.get('files_changed', 0),
+                    stats.get('insertions', 0),
+                    stats.get('deletions', 0)
+                )
+                for commit in commits
+                for stats in (commit.get('stats', {}),)
+            )
         
         print(f"Commit report saved to {csv_path}")
     
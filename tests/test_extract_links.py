@@ -0,0 +1,68 @@
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import extract_links
+from extract_links import extract_text_from_docx, find_links_in_tree
+
+
+@pytest.mark.parametrize('line', [
+    '| https://x.netlify.app|https://github.com/o/r|',
+    '|https://x.netlify.app|https://github.com/o/r|',
+    '[Live](https://x.netlify.app),[Repo](https://github.com/o/r)',
+    'https://x.netlify.app/?ref=https://github.com/o/r',
+])
+def test_adjacent_links_are_both_found(tmp_path, line):
+    (tmp_path / 'README.md').write_text(f"Links\n{line}\n")
+
+    owner, github_url, netlify = find_links_in_tree(str(tmp_path))
+
+    assert owner == 'o'
+    assert github_url == 'https://github.com/o/r'
+    assert netlify.startswith('https://x.netlify.app')
+
+
+def test_docx_text_keeps_only_visible_runs(tmp_path):
+    xml = (
+        '<w:document><w:body><w:p>'
+        '<w:r><w:instrText xml:space="preserve"> HYPERLINK </w:instrText></w:r>'
+        '<w:del><w:r><w:delText>old</w:delText></w:r></w:del>'
+        '<w:r><w:t>https://github.com/o/r?a=1&amp;b=2</w:t></w:r>'
+        '<w:r><w:t/></w:r><w:r><w:tab/><w:t xml:space="preserve">x</w:t></w:r>'
+        '</w:p></w:body></w:document>'
+    )
+    path = tmp_path / 'links.docx'
+    with zipfile.ZipFile(path, 'w') as docx:
+        docx.writestr('word/document.xml', xml)
+
+    assert extract_text_from_docx(str(path)) == 'https://github.com/o/r?a=1&b=2\nx\n'
+
+
+def test_single_pdf_is_cached_even_when_links_are_on_the_first_page(tmp_path, monkeypatch):
+    pages = ['https://github.com/o/r https://x.netlify.app', 'page two']
+    monkeypatch.setattr(extract_links, 'iter_pdf_pages', lambda data: iter(pages))
+    student = tmp_path / 'student'
+    student.mkdir()
+    (student / 'report.pdf').write_bytes(b'%PDF /Font')
+    cache_dir = tmp_path / 'cache'
+
+    assert find_links_in_tree(str(student), cache_dir=str(cache_dir))[0] == 'o'
+
+    (cache_entry,) = cache_dir.iterdir()
+    assert cache_entry.read_text(encoding='utf-8') == '\n'.join(pages)
+
+
+def test_unwritable_cache_dir_still_returns_text(tmp_path, monkeypatch):
+    monkeypatch.setattr(extract_links, 'iter_pdf_pages', lambda data: iter(['https://github.com/o/r']))
+    student = tmp_path / 'student'
+    student.mkdir()
+    (student / 'report.pdf').write_bytes(b'%PDF /Font')
+    cache_dir = tmp_path / 'cache'
+    cache_dir.write_text('not a directory')
+
+    assert find_links_in_tree(str(student), cache_dir=str(cache_dir))[0] == 'o'
+    assert list(tmp_path.glob('*.tmp')) == []